@@ -8,25 +8,37 @@ Based on the framework from iloveseo.net
 """
 
 import streamlit as st
-from datetime import datetime
+import time
+from typing import Any, Callable
 
 # Import framework components
 from config.templates import (
     BrandFoundationConfig,
     SourceMode,
     BusinessGoalType,
+    BUSINESS_GOAL_NAMES,
 )
-from core.ontology_builder import OntologyBuilder
-from core.entity_search import EntitySearchExpander
-from core.taxonomy_builder import TaxonomyBuilder
-from core.query_mapper import QueryMapper
-from core.hub_designer import HubDesigner
-from core.content_specs import ContentSpecGenerator
-from core.measurement_setup import MeasurementSetup
-from utils.data_models import FrameworkOutput
-from utils.exporters import Exporter
+from utils.data_models import ContentPriority, FrameworkOutput
 from utils.validators import InputValidator
 
+# Configuration form options, built once at import rather than per rerun
+_BUSINESS_GOAL_OPTIONS = BUSINESS_GOAL_NAMES
+_BUSINESS_GOAL_LABELS = {g: g.replace("_", " ").title() for g in _BUSINESS_GOAL_OPTIONS}
+_fmt_goal = _BUSINESS_GOAL_LABELS.__getitem__
+
+_SOURCE_MODE_LABELS = {
+    "seed": "Seed Entities (Manual)",
+    "sitemap": "Sitemap (Auto-extract)",
+    "hybrid": "Hybrid (Both)",
+}
+_SOURCE_MODE_OPTIONS = tuple(_SOURCE_MODE_LABELS)
+_fmt_source = _SOURCE_MODE_LABELS.__getitem__
+
+_REGION_OPTIONS = ("US", "UK", "EU", "APAC", "Global")
+
+# Enum lookups for form values (plain dict hits instead of Enum calls)
+_MODE_BY_VALUE = {m.value: m for m in SourceMode}
+
 # Page configuration
 st.set_page_config(
     page_title="AI Search Visibility Optimizer",
@@ -35,8 +47,9 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
+
 # Custom CSS
-st.markdown("""
+_APP_CSS = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -65,7 +78,7 @@ st.markdown("""
         background: linear-gradient(90deg, #1f77b4, #2ca02c);
     }
 </style>
-""", unsafe_allow_html=True)
+"""
 
 
 def init_session_state():
@@ -76,55 +89,63 @@ def init_session_state():
         st.session_state.config = None
     if "output" not in st.session_state:
         st.session_state.output = None
+    if "views" not in st.session_state:
+        st.session_state.views = None
     if "processing" not in st.session_state:
         st.session_state.processing = False
 
 
+@st.fragment
 def render_sidebar():
-    """Render the sidebar with navigation and info."""
-    with st.sidebar:
-        st.markdown("### Navigation")
-
-        steps = [
-            "Configuration",
-            "1. Ontology",
-            "2. Entities",
-            "3. Taxonomy",
-            "4. Queries",
-            "5. Hubs",
-            "6. Content",
-            "7. Measurement",
-            "Export",
-        ]
-
-        for i, step_name in enumerate(steps):
-            if i <= st.session_state.step:
-                if st.button(step_name, key=f"nav_{i}", use_container_width=True):
-                    st.session_state.step = i
-            else:
-                st.button(
-                    step_name,
-                    key=f"nav_{i}",
-                    use_container_width=True,
-                    disabled=True,
-                )
+    """
+    Render the sidebar with navigation and info.
+
+    Call inside ``with st.sidebar:`` - fragments cannot open the sidebar
+    container themselves.
+    """
+    st.markdown("### Navigation")
+
+    steps = [
+        "Configuration",
+        "1. Ontology",
+        "2. Entities",
+        "3. Taxonomy",
+        "4. Queries",
+        "5. Hubs",
+        "6. Content",
+        "7. Measurement",
+        "Export",
+    ]
+
+    for i, step_name in enumerate(steps):
+        if i <= st.session_state.step:
+            if st.button(step_name, key=f"nav_{i}", use_container_width=True):
+                st.session_state.step = i
+                st.rerun()
+        else:
+            st.button(
+                step_name,
+                key=f"nav_{i}",
+                use_container_width=True,
+                disabled=True,
+            )
 
-        st.markdown("---")
-        st.markdown("### About")
-        st.markdown("""
-        This tool implements the **7-Step AI Search Visibility Framework**
-        for optimizing content to appear in AI-generated responses.
+    st.markdown("---")
+    st.markdown("### About")
+    st.markdown("""
+    This tool implements the **7-Step AI Search Visibility Framework**
+    for optimizing content to appear in AI-generated responses.
 
-        [Learn more about the framework](https://www.iloveseo.net/what-framework-to-use-for-increasing-visibility-in-ai-search/)
-        """)
+    [Learn more about the framework](https://www.iloveseo.net/what-framework-to-use-for-increasing-visibility-in-ai-search/)
+    """)
 
-        if st.session_state.output:
-            st.markdown("---")
-            st.markdown("### Quick Stats")
-            summary = st.session_state.output.summary
-            st.metric("Entities", summary.get("total_entities", 0))
-            st.metric("Query Clusters", summary.get("query_clusters", 0))
-            st.metric("Content Pages", summary.get("total_pages_planned", 0))
+    if st.session_state.output:
+        st.markdown("---")
+        st.markdown("### Quick Stats")
+        summary = st.session_state.output.summary
+        st.metric("Entities", summary.get("total_entities", 0))
+        st.metric("Query Clusters", summary.get("query_clusters", 0))
+        st.metric("Content Pages", summary.get("total_pages_planned", 0))
 
 
 def render_configuration_step():
@@ -132,106 +153,113 @@ def render_configuration_step():
     st.markdown('<p class="main-header">AI Search Visibility Optimizer</p>', unsafe_allow_html=True)
     st.markdown('<p class="sub-header">Configure your brand foundation to generate a comprehensive AI visibility roadmap</p>', unsafe_allow_html=True)
 
-    col1, col2 = st.columns(2)
+    # The source mode stays outside the form: it decides which inputs the
+    # form shows, so changing it has to rerun immediately.
+    source_mode = st.radio(
+        "Entity Source",
+        options=_SOURCE_MODE_OPTIONS,
+        format_func=_fmt_source,
+        horizontal=True,
+        help="How to identify your initial entities",
+    )
+
+    # Other inputs are batched in a form so they only rerun on submit
+    with st.form("config_form", clear_on_submit=False):
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.markdown("### Brand Foundation")
+
+            brand_name = st.text_input(
+                "Brand Name *",
+                placeholder="e.g., Acme Corp",
+                help="Your company or product name",
+            )
 
-    with col1:
-        st.markdown("### Brand Foundation")
+            primary_niche = st.text_input(
+                "Primary Niche *",
+                placeholder="e.g., Project Management Software",
+                help="Your main industry or category",
+            )
 
-        brand_name = st.text_input(
-            "Brand Name *",
-            placeholder="e.g., Acme Corp",
-            help="Your company or product name",
-        )
+            business_goals = st.multiselect(
+                "Business Goals *",
+                options=_BUSINESS_GOAL_OPTIONS,
+                format_func=_fmt_goal,
+                help="Select one or more business objectives",
+            )
 
-        primary_niche = st.text_input(
-            "Primary Niche *",
-            placeholder="e.g., Project Management Software",
-            help="Your main industry or category",
-        )
+        with col2:
+            st.markdown("### Data Source")
 
-        business_goals = st.multiselect(
-            "Business Goals *",
-            options=[g.value for g in BusinessGoalType],
-            format_func=lambda x: x.replace("_", " ").title(),
-            help="Select one or more business objectives",
-        )
+            if source_mode in ["seed", "hybrid"]:
+                seed_entities_text = st.text_area(
+                    "Seed Entities (one per line)",
+                    placeholder="project management\ntask tracking\nteam collaboration\nworkflow automation",
+                    height=120,
+                    help="Enter your core topics/entities",
+                )
+                seed_entities = [
+                    e.strip() for e in seed_entities_text.split("\n")
+                    if e.strip()
+                ]
+            else:
+                seed_entities = []
 
-    with col2:
-        st.markdown("### Data Source")
-
-        source_mode = st.radio(
-            "Entity Source",
-            options=["seed", "sitemap", "hybrid"],
-            format_func=lambda x: {
-                "seed": "Seed Entities (Manual)",
-                "sitemap": "Sitemap (Auto-extract)",
-                "hybrid": "Hybrid (Both)",
-            }[x],
-            help="How to identify your initial entities",
-        )
+            if source_mode in ["sitemap", "hybrid"]:
+                sitemap_url = st.text_input(
+                    "Sitemap URL",
+                    placeholder="https://example.com/sitemap.xml",
+                    help="URL to your XML sitemap",
+                )
+            else:
+                sitemap_url = None
+
+        st.markdown("### Optional Settings")
+
+        col3, col4 = st.columns(2)
 
-        if source_mode in ["seed", "hybrid"]:
-            seed_entities_text = st.text_area(
-                "Seed Entities (one per line)",
-                placeholder="project management\ntask tracking\nteam collaboration\nworkflow automation",
-                height=120,
-                help="Enter your core topics/entities",
+        with col3:
+            competitors_text = st.text_area(
+                "Competitors (one per line)",
+                placeholder="Competitor A\nCompetitor B",
+                height=80,
+                help="Optional: List your main competitors",
             )
-            seed_entities = [
-                e.strip() for e in seed_entities_text.split("\n")
-                if e.strip()
+            competitors = [
+                c.strip() for c in competitors_text.split("\n")
+                if c.strip()
             ]
-        else:
-            seed_entities = []
 
-        if source_mode in ["sitemap", "hybrid"]:
-            sitemap_url = st.text_input(
-                "Sitemap URL",
-                placeholder="https://example.com/sitemap.xml",
-                help="URL to your XML sitemap",
+        with col4:
+            target_regions = st.multiselect(
+                "Target Regions",
+                options=_REGION_OPTIONS,
+                default=["US"],
+                help="Primary target markets",
             )
-        else:
-            sitemap_url = None
-
-    st.markdown("### Optional Settings")
 
-    col3, col4 = st.columns(2)
-
-    with col3:
-        competitors_text = st.text_area(
-            "Competitors (one per line)",
-            placeholder="Competitor A\nCompetitor B",
-            height=80,
-            help="Optional: List your main competitors",
-        )
-        competitors = [
-            c.strip() for c in competitors_text.split("\n")
-            if c.strip()
-        ]
+        st.markdown("---")
 
-    with col4:
-        target_regions = st.multiselect(
-            "Target Regions",
-            options=["US", "UK", "EU", "APAC", "Global"],
-            default=["US"],
-            help="Primary target markets",
+        submitted = st.form_submit_button(
+            "Generate AI Visibility Roadmap",
+            type="primary",
+            use_container_width=True,
         )
 
-    st.markdown("---")
-
     # Validation and submission
-    if st.button("Generate AI Visibility Roadmap", type="primary", use_container_width=True):
+    if submitted:
         # Create config
         try:
             config = BrandFoundationConfig(
                 brand_name=brand_name,
                 primary_niche=primary_niche,
-                business_goals=[BusinessGoalType(g) for g in business_goals],
-                source_mode=SourceMode(source_mode),
+                business_goals=BusinessGoalType.from_strings(business_goals),
+                source_mode=_MODE_BY_VALUE[source_mode],
                 sitemap_url=sitemap_url,
-                seed_entities=seed_entities,
-                competitors=competitors,
-                target_regions=target_regions,
+                seed_entities=tuple(seed_entities),
+                competitors=tuple(competitors),
+                target_regions=tuple(target_regions),
             )
 
             # Validate
@@ -256,83 +284,155 @@ def render_configuration_step():
             st.error(f"Configuration error: {str(e)}")
 
 
+@st.cache_resource(ttl=3600, max_entries=32, show_spinner=False)
+def _run_pipeline(
+    fingerprint: bytes,
+    _config: BrandFoundationConfig,
+    _on_step: Callable[[int, str], None] | None = None,
+) -> tuple[FrameworkOutput, dict[str, Any]]:
+    """
+    Run the 7-step pipeline for a configuration.
+
+    Returns the FrameworkOutput together with the display previews built by
+    _display_views. Cached per configuration fingerprint so regenerating an
+    unchanged config returns the existing pair instead of re-running every
+    step. The result is shared rather than copied, so callers must not mutate it.
+    ``_config`` and ``_on_step`` are excluded from the cache key; the latter
+    only fires on a miss.
+    """
+    # Imported here so a cold start only pays for them once a roadmap is generated
+    from core.ontology_builder import OntologyBuilder
+    from core.entity_search import EntitySearchExpander
+    from core.taxonomy_builder import TaxonomyBuilder
+    from core.query_mapper import QueryMapper
+    from core.hub_designer import HubDesigner
+    from core.content_specs import ContentSpecGenerator
+    from core.measurement_setup import MeasurementSetup
+
+    config = _config
+    report = _on_step or (lambda pct, text: None)
+
+    # Step 1: Build Ontology
+    report(10, "Step 1: Building brand ontology...")
+    ontology_builder = OntologyBuilder(config)
+    ontology = ontology_builder.build()
+
+    # Step 2: Expand Entities
+    report(25, "Step 2: Expanding entities...")
+    entity_expander = EntitySearchExpander(ontology)
+    ontology = entity_expander.expand_all_entities()
+
+    # Step 3: Build Taxonomy
+    report(40, "Step 3: Building taxonomy...")
+    taxonomy_builder = TaxonomyBuilder(ontology, config.primary_niche)
+    taxonomy = taxonomy_builder.build()
+
+    # Step 4: Map Queries
+    report(55, "Step 4: Mapping queries...")
+    query_mapper = QueryMapper(ontology)
+    query_clusters = query_mapper.map_all_entities()
+
+    # Step 5: Design Hubs
+    report(70, "Step 5: Designing content hubs...")
+    hub_designer = HubDesigner(ontology, taxonomy, query_clusters)
+    content_hubs = hub_designer.design_all_hubs()
+
+    # Step 6: Generate Content Specs
+    report(85, "Step 6: Generating content specifications...")
+    spec_generator = ContentSpecGenerator(ontology, content_hubs, config.brand_name)
+    personas, content_specs = spec_generator.generate_all_specs()
+
+    # Step 7: Setup Measurement
+    report(95, "Step 7: Setting up measurement framework...")
+    measurement_setup = MeasurementSetup(
+        ontology=ontology,
+        query_clusters=query_clusters,
+        content_hubs=content_hubs,
+        content_specs=content_specs,
+        brand_name=config.brand_name,
+        competitors=config.competitors,
+    )
+    measurement_plan = measurement_setup.create_measurement_plan()
+
+    # Create output
+    output = FrameworkOutput(
+        brand_name=config.brand_name,
+        primary_niche=config.primary_niche,
+        ontology=ontology,
+        taxonomy=taxonomy,
+        query_clusters=query_clusters,
+        content_hubs=content_hubs,
+        personas=personas,
+        content_specs=content_specs,
+        measurement_plan=measurement_plan,
+    )
+    output.generate_summary()
+    output.index()
+
+    return output, _display_views(output)
+
+
+def _display_views(output: FrameworkOutput) -> dict[str, Any]:
+    """Previews the step renderers show, built once per pipeline run."""
+    ontology = output.ontology
+    entities = ontology.entities if ontology else []
+    return {
+        "alias_previews": [
+            ", ".join(e.aliases[:3]) + ("..." if len(e.aliases) > 3 else "") for e in entities
+        ],
+        "relationships_preview": ontology.relationships[:20] if ontology else [],
+        "critical_specs": [
+            s for s in output.content_specs if s.priority is ContentPriority.CRITICAL
+        ][:5],
+    }
+
+
 def process_framework():
     """Process the complete framework pipeline."""
     config = st.session_state.config
 
-    progress = st.progress(0, text="Starting framework processing...")
+    placeholder = st.empty()
+    progress = placeholder.progress(0, text="Starting framework processing...")
+    last_stage_start = float("-inf")
+
+    def _update(pct: int, text: str, *, min_interval: float = 0.1):
+        """Announce the next stage, unless the previous stage finished within min_interval."""
+        nonlocal last_stage_start
+        now = time.monotonic()
+        previous_start, last_stage_start = last_stage_start, now
+        if now - previous_start >= min_interval:
+            progress.progress(pct, text=text)
 
     try:
-        # Step 1: Build Ontology
-        progress.progress(10, text="Step 1: Building brand ontology...")
-        ontology_builder = OntologyBuilder(config)
-        ontology = ontology_builder.build()
-
-        # Step 2: Expand Entities
-        progress.progress(25, text="Step 2: Expanding entities...")
-        entity_expander = EntitySearchExpander(ontology)
-        ontology = entity_expander.expand_all_entities()
-
-        # Step 3: Build Taxonomy
-        progress.progress(40, text="Step 3: Building taxonomy...")
-        taxonomy_builder = TaxonomyBuilder(ontology, config.primary_niche)
-        taxonomy = taxonomy_builder.build()
-
-        # Step 4: Map Queries
-        progress.progress(55, text="Step 4: Mapping queries...")
-        query_mapper = QueryMapper(ontology)
-        query_clusters = query_mapper.map_all_entities()
-
-        # Step 5: Design Hubs
-        progress.progress(70, text="Step 5: Designing content hubs...")
-        hub_designer = HubDesigner(ontology, taxonomy, query_clusters)
-        content_hubs = hub_designer.design_all_hubs()
-
-        # Step 6: Generate Content Specs
-        progress.progress(85, text="Step 6: Generating content specifications...")
-        spec_generator = ContentSpecGenerator(ontology, content_hubs, config.brand_name)
-        personas, content_specs = spec_generator.generate_all_specs()
-
-        # Step 7: Setup Measurement
-        progress.progress(95, text="Step 7: Setting up measurement framework...")
-        measurement_setup = MeasurementSetup(
-            ontology=ontology,
-            query_clusters=query_clusters,
-            content_hubs=content_hubs,
-            content_specs=content_specs,
-            brand_name=config.brand_name,
-            competitors=config.competitors,
-        )
-        measurement_plan = measurement_setup.create_measurement_plan()
-
-        # Create output
-        output = FrameworkOutput(
-            brand_name=config.brand_name,
-            primary_niche=config.primary_niche,
-            ontology=ontology,
-            taxonomy=taxonomy,
-            query_clusters=query_clusters,
-            content_hubs=content_hubs,
-            personas=personas,
-            content_specs=content_specs,
-            measurement_plan=measurement_plan,
-        )
-        output.generate_summary()
+        output, views = _run_pipeline(config.fingerprint, _config=config, _on_step=_update)
 
         progress.progress(100, text="Complete!")
 
         st.session_state.output = output
+        st.session_state.views = views
         st.session_state.processing = False
         st.session_state.step = 1
 
         st.rerun()
 
     except Exception as e:
-        progress.empty()
+        placeholder.empty()
         st.error(f"Processing error: {str(e)}")
         st.session_state.processing = False
 
 
+def _histogram_table(counts: dict[str, int], label: str):
+    """Two-column (label, count) Arrow table for st.bar_chart."""
+    # Imported here so a cold start only pays for it once a chart is drawn
+    import pyarrow as pa
+
+    return pa.Table.from_arrays(
+        [pa.array(list(counts), pa.string()), pa.array(list(counts.values()), pa.int64())],
+        names=[label, "count"],
+    )
+
+
+@st.fragment
 def render_step_1_ontology():
     """Render Step 1: Ontology visualization."""
     st.markdown('<p class="step-header">Step 1: Brand Ontology</p>', unsafe_allow_html=True)
@@ -347,37 +447,46 @@ def render_step_1_ontology():
     with col2:
         st.metric("Relationships", len(ontology.relationships))
     with col3:
-        counts = ontology.entity_count_by_type()
-        st.metric("Core Entities", counts.get("core", 0))
+        st.metric("Core Entities", output.entity_counts_by_type.get("core", 0))
 
     # Entity list
     st.markdown("### Entities")
 
-    entity_df_data = []
-    for entity in ontology.entities:
-        entity_df_data.append({
-            "Name": entity.name,
-            "Type": entity.type.value,
-            "Centrality": f"{entity.semantic_centrality:.2f}",
-            "Commercial Value": f"{entity.commercial_value:.2f}",
-            "Aliases": ", ".join(entity.aliases[:3]) + ("..." if len(entity.aliases) > 3 else ""),
-        })
+    entities = ontology.entities
+    entity_table = {
+        "Name": [e.name for e in entities],
+        "Type": [e.type.value for e in entities],
+        "Centrality": [e.semantic_centrality for e in entities],
+        "Commercial Value": [e.commercial_value for e in entities],
+        "Aliases": st.session_state.views["alias_previews"],
+    }
 
-    st.dataframe(entity_df_data, use_container_width=True)
+    # Scores stay numeric so the grid sorts them; formatting happens client-side
+    st.dataframe(
+        entity_table,
+        column_config={
+            "Centrality": st.column_config.NumberColumn(format="%.2f"),
+            "Commercial Value": st.column_config.NumberColumn(format="%.2f"),
+        },
+        use_container_width=True,
+    )
 
     # Relationships
     with st.expander("View Relationships"):
-        entity_names = {e.id: e.name for e in ontology.entities}
-        for rel in ontology.relationships[:20]:
-            source = entity_names.get(rel.source_id, rel.source_id)
-            target = entity_names.get(rel.target_id, rel.target_id)
-            st.text(f"{source} → {rel.relationship_type.value} → {target}")
+        entity_names = output.entity_names_by_id
+        st.text("\n".join(
+            f"{entity_names.get(rel.source_id, rel.source_id)} → "
+            f"{rel.relationship_type.value} → "
+            f"{entity_names.get(rel.target_id, rel.target_id)}"
+            for rel in st.session_state.views["relationships_preview"]
+        ))
 
     if st.button("Next: Entity Expansion →", type="primary"):
         st.session_state.step = 2
         st.rerun()
 
 
+@st.fragment
 def render_step_2_entities():
     """Render Step 2: Entity expansion details."""
     st.markdown('<p class="step-header">Step 2: Entity Expansion</p>', unsafe_allow_html=True)
@@ -387,7 +496,7 @@ def render_step_2_entities():
     ontology = output.ontology
 
     # Expansion stats
-    total_aliases = sum(len(e.aliases) for e in ontology.entities)
+    total_aliases = output.total_aliases
 
     col1, col2 = st.columns(2)
     with col1:
@@ -420,6 +529,7 @@ def render_step_2_entities():
             st.rerun()
 
 
+@st.fragment
 def render_step_3_taxonomy():
     """Render Step 3: Taxonomy structure."""
     st.markdown('<p class="step-header">Step 3: Taxonomy Structure</p>', unsafe_allow_html=True)
@@ -440,15 +550,19 @@ def render_step_3_taxonomy():
     # Tree view
     st.markdown("### Category Hierarchy")
 
-    root_nodes = taxonomy.get_root_nodes()
+    children_by_parent = output.children_by_parent
+    root_nodes = children_by_parent.get(None, ())
+    tree_lines = []
     for root in root_nodes:
-        st.markdown(f"**{root.name}**")
-        children = taxonomy.get_children(root.id)
+        tree_lines.append(f"**{root.name}**")
+        children = children_by_parent.get(root.id, ())
         for child in children:
-            st.markdown(f"  └─ {child.name}")
-            grandchildren = taxonomy.get_children(child.id)
+            tree_lines.append(f"└─ {child.name}")
+            grandchildren = children_by_parent.get(child.id, ())
             for gc in grandchildren[:3]:
-                st.markdown(f"      └─ {gc.name}")
+                tree_lines.append(f"&emsp;&emsp;└─ {gc.name}")
+    # Trailing double space forces a markdown line break between nodes
+    st.markdown("  \n".join(tree_lines))
 
     # Facets
     if taxonomy.facet_definitions:
@@ -467,6 +581,7 @@ def render_step_3_taxonomy():
             st.rerun()
 
 
+@st.fragment
 def render_step_4_queries():
     """Render Step 4: Query mapping."""
     st.markdown('<p class="step-header">Step 4: Query Mapping</p>', unsafe_allow_html=True)
@@ -489,21 +604,17 @@ def render_step_4_queries():
     # Intent distribution
     st.markdown("### Intent Distribution")
 
-    intent_totals = {}
-    for cluster in clusters:
-        for intent, count in cluster.intent_distribution.items():
-            intent_totals[intent] = intent_totals.get(intent, 0) + count
-
-    intent_df = [{"Intent": k, "Count": v} for k, v in intent_totals.items()]
-    st.bar_chart(data={d["Intent"]: d["Count"] for d in intent_df})
+    st.bar_chart(_histogram_table(output.intent_totals, "intent"), x="intent", y="count")
 
     # Query clusters
     st.markdown("### Query Clusters")
 
     for cluster in clusters[:5]:
         with st.expander(f"{cluster.primary_entity_name} ({len(cluster.queries)} queries)"):
-            for query in cluster.queries[:10]:
-                st.text(f"[{query.intent.value}] {query.query_text}")
+            st.text("\n".join(
+                f"[{query.intent.value}] {query.query_text}"
+                for query in cluster.queries[:10]
+            ))
 
     col1, col2 = st.columns(2)
     with col1:
@@ -516,6 +627,7 @@ def render_step_4_queries():
             st.rerun()
 
 
+@st.fragment
 def render_step_5_hubs():
     """Render Step 5: Content hub design."""
     st.markdown('<p class="step-header">Step 5: Content Hub Architecture</p>', unsafe_allow_html=True)
@@ -524,16 +636,13 @@ def render_step_5_hubs():
     output = st.session_state.output
     hubs = output.content_hubs
 
-    total_pages = sum(len(h.all_pages()) for h in hubs)
-    total_links = sum(h.internal_link_count for h in hubs)
-
     col1, col2, col3 = st.columns(3)
     with col1:
         st.metric("Content Hubs", len(hubs))
     with col2:
-        st.metric("Total Pages", total_pages)
+        st.metric("Total Pages", output.total_pages)
     with col3:
-        st.metric("Internal Links", total_links)
+        st.metric("Internal Links", output.total_internal_links)
 
     # Hub details
     st.markdown("### Hub Details")
@@ -544,9 +653,10 @@ def render_step_5_hubs():
                 st.markdown(f"**Pillar:** {hub.pillar_page.title}")
 
             st.markdown("**Cluster Pages:**")
-            for page in hub.cluster_pages:
-                status = "✅" if page.status == "exists" else "📝"
-                st.text(f"  {status} {page.title}")
+            st.text("\n".join(
+                f"  {'✅' if page.status == 'exists' else '📝'} {page.title}"
+                for page in hub.cluster_pages
+            ))
 
             st.markdown(f"**Internal Links:** {hub.internal_link_count}")
 
@@ -561,6 +671,7 @@ def render_step_5_hubs():
             st.rerun()
 
 
+@st.fragment
 def render_step_6_content():
     """Render Step 6: Content specifications."""
     st.markdown('<p class="step-header">Step 6: Content Specifications</p>', unsafe_allow_html=True)
@@ -590,25 +701,18 @@ def render_step_6_content():
     # Priority breakdown
     st.markdown("### Content by Priority")
 
-    priority_counts = {}
-    for spec in specs:
-        p = spec.priority.value
-        priority_counts[p] = priority_counts.get(p, 0) + 1
-
-    st.bar_chart(priority_counts)
+    st.bar_chart(_histogram_table(output.priority_counts, "priority"), x="priority", y="count")
 
     # Top content specs
     st.markdown("### Critical Priority Content")
 
-    critical = [s for s in specs if s.priority.value == "critical"]
-    for spec in critical[:5]:
+    for spec in st.session_state.views["critical_specs"]:
         with st.expander(spec.title):
             st.markdown(f"**Format:** {spec.recommended_format}")
             st.markdown(f"**Primary Query:** {spec.primary_query}")
             st.markdown(f"**Word Count:** {spec.word_count_target}")
             st.markdown("**Structure:**")
-            for section in spec.content_structure[:5]:
-                st.text(f"  • {section}")
+            st.text("\n".join(f"  • {section}" for section in spec.content_structure[:5]))
 
     col1, col2 = st.columns(2)
     with col1:
@@ -621,6 +725,7 @@ def render_step_6_content():
             st.rerun()
 
 
+@st.fragment
 def render_step_7_measurement():
     """Render Step 7: Measurement framework."""
     st.markdown('<p class="step-header">Step 7: Measurement Framework</p>', unsafe_allow_html=True)
@@ -640,27 +745,26 @@ def render_step_7_measurement():
     # KPIs
     st.markdown("### Key Performance Indicators")
 
-    kpi_data = []
-    for kpi in plan.kpis:
-        kpi_data.append({
-            "KPI": kpi.name,
-            "Priority": kpi.priority,
-            "Cadence": kpi.refresh_cadence,
-        })
+    kpi_table = {
+        "KPI": [kpi.name for kpi in plan.kpis],
+        "Priority": [kpi.priority for kpi in plan.kpis],
+        "Cadence": [kpi.refresh_cadence for kpi in plan.kpis],
+    }
 
-    st.dataframe(kpi_data, use_container_width=True)
+    st.dataframe(kpi_table, use_container_width=True)
 
     # AI Monitoring Queries
     st.markdown("### AI Monitoring Queries")
     st.markdown("Track these queries in ChatGPT, Perplexity, and AI Overviews:")
 
-    for query in plan.ai_monitoring_queries[:10]:
-        st.text(f"• {query}")
+    st.text("\n".join(f"• {query}" for query in plan.ai_monitoring_queries[:10]))
 
     # Refresh Schedule
     st.markdown("### Content Refresh Schedule")
-    for content_type, cadence in plan.refresh_schedule.items():
-        st.text(f"• {content_type}: {cadence}")
+    st.text("\n".join(
+        f"• {content_type}: {cadence}"
+        for content_type, cadence in plan.refresh_schedule.items()
+    ))
 
     col1, col2 = st.columns(2)
     with col1:
@@ -673,8 +777,11 @@ def render_step_7_measurement():
             st.rerun()
 
 
+@st.fragment
 def render_export_step():
     """Render the export step."""
+    from utils.exporters import Exporter
+
     st.markdown('<p class="step-header">Export Your Roadmap</p>', unsafe_allow_html=True)
     st.markdown("Download your AI visibility roadmap in various formats")
 
@@ -696,26 +803,24 @@ def render_export_step():
 
     st.markdown("---")
 
-    # Export options
+    # Export options (data callables only serialize when clicked)
     st.markdown("### Download Options")
 
     col1, col2 = st.columns(2)
 
     with col1:
         # JSON export
-        json_data = Exporter.to_json(output)
         st.download_button(
             label="Download Complete JSON",
-            data=json_data,
+            data=lambda: Exporter.to_json(output),
             file_name=f"{output.brand_name.lower().replace(' ', '_')}_roadmap.json",
             mime="application/json",
         )
 
         # Markdown export
-        md_data = Exporter.to_markdown(output)
         st.download_button(
             label="Download Markdown Summary",
-            data=md_data,
+            data=lambda: Exporter.to_markdown(output),
             file_name=f"{output.brand_name.lower().replace(' ', '_')}_roadmap.md",
             mime="text/markdown",
         )
@@ -723,28 +828,25 @@ def render_export_step():
     with col2:
         # CSV exports
         if output.ontology:
-            entities_csv = Exporter.entities_to_csv(output.ontology)
             st.download_button(
                 label="Download Entities CSV",
-                data=entities_csv,
+                data=lambda: Exporter.entities_to_csv(output.ontology),
                 file_name="entities.csv",
                 mime="text/csv",
             )
 
         if output.query_clusters:
-            queries_csv = Exporter.queries_to_csv(output.query_clusters)
             st.download_button(
                 label="Download Queries CSV",
-                data=queries_csv,
+                data=lambda: Exporter.queries_to_csv(output.query_clusters),
                 file_name="queries.csv",
                 mime="text/csv",
             )
 
         if output.content_hubs:
-            hubs_csv = Exporter.content_hubs_to_csv(output.content_hubs)
             st.download_button(
                 label="Download Content Plan CSV",
-                data=hubs_csv,
+                data=lambda: Exporter.content_hubs_to_csv(output.content_hubs),
                 file_name="content_plan.csv",
                 mime="text/csv",
             )
@@ -766,40 +868,48 @@ def render_export_step():
         st.session_state.step = 0
         st.session_state.config = None
         st.session_state.output = None
+        st.session_state.views = None
         st.rerun()
 
 
+# Step renderers indexed by st.session_state.step
+_STEP_RENDERERS = (
+    render_configuration_step,
+    render_step_1_ontology,
+    render_step_2_entities,
+    render_step_3_taxonomy,
+    render_step_4_queries,
+    render_step_5_hubs,
+    render_step_6_content,
+    render_step_7_measurement,
+    render_export_step,
+)
+
+
 def main():
     """Main application entry point."""
     init_session_state()
-    render_sidebar()
+
+    # Style-only st.html goes to the event container, so it takes no layout
+    # space. It is re-emitted each run because Streamlit drops elements that
+    # a rerun doesn't redraw.
+    st.html(_APP_CSS)
+
+    with st.sidebar:
+        render_sidebar()
 
     # Handle processing state
     if st.session_state.processing:
         process_framework()
         return
 
-    # Render appropriate step
+    # Render appropriate step. Each renderer is a fragment, so its own
+    # widgets rerun only that step; changing step calls st.rerun() for a
+    # full rerun so the sidebar and page body both update.
     step = st.session_state.step
-
-    if step == 0:
-        render_configuration_step()
-    elif step == 1:
-        render_step_1_ontology()
-    elif step == 2:
-        render_step_2_entities()
-    elif step == 3:
-        render_step_3_taxonomy()
-    elif step == 4:
-        render_step_4_queries()
-    elif step == 5:
-        render_step_5_hubs()
-    elif step == 6:
-        render_step_6_content()
-    elif step == 7:
-        render_step_7_measurement()
-    elif step == 8:
-        render_export_step()
+    if not 0 <= step < len(_STEP_RENDERERS):
+        step = 0
+    _STEP_RENDERERS[step]()
 
 
 if __name__ == "__main__":
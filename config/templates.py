@@ -1,8 +1,18 @@
 """Input configuration templates for the AI Search Visibility Framework."""
 
-from dataclasses import dataclass, field
-from typing import Literal
-from enum import Enum
+import sys
+import hashlib
+import json
+from dataclasses import dataclass, field, fields
+from types import MappingProxyType
+from itertools import islice
+from typing import Any, Iterable, Iterator
+from enum import Enum, IntFlag
+
+
+# Shared immutable defaults for BrandFoundationConfig
+_DEFAULT_REGIONS = ("US",)
+_DEFAULT_LANGUAGES = ("en",)
 
 
 class SourceMode(str, Enum):
@@ -12,47 +22,89 @@ class SourceMode(str, Enum):
     HYBRID = "hybrid"
 
 
-class BusinessGoalType(str, Enum):
-    """Types of business goals for strategic alignment."""
-    BRAND_AWARENESS = "brand_awareness"
-    LEAD_GENERATION = "lead_generation"
-    ECOMMERCE_SALES = "ecommerce_sales"
-    THOUGHT_LEADERSHIP = "thought_leadership"
-    LOCAL_VISIBILITY = "local_visibility"
-    PRODUCT_ADOPTION = "product_adoption"
+class BusinessGoalType(IntFlag):
+    """
+    Types of business goals for strategic alignment.
+
+    Goals combine into a single flag value, so checking for a goal is a
+    bitwise test: ``config.business_goals & BusinessGoalType.ECOMMERCE_SALES``.
+    """
+    BRAND_AWARENESS = 1
+    LEAD_GENERATION = 2
+    ECOMMERCE_SALES = 4
+    THOUGHT_LEADERSHIP = 8
+    LOCAL_VISIBILITY = 16
+    PRODUCT_ADOPTION = 32
+
+    @classmethod
+    def from_strings(cls, names: Iterable[str]) -> "BusinessGoalType":
+        """Combine goal names such as "brand_awareness" into one flag value."""
+        goals = cls(0)
+        for name in names:
+            goals |= _GOAL_BY_NAME[name]
+        return goals
+
+    def to_strings(self) -> tuple[str, ...]:
+        """Names of the goals set in this value, in declaration order."""
+        return tuple(name for name, goal in _GOAL_ITEMS if self & goal)
+
 
+# Serialized goal names, parallel to BusinessGoalType declaration order
+BUSINESS_GOAL_NAMES = tuple(goal.name.lower() for goal in BusinessGoalType)
+_GOAL_ITEMS = tuple(zip(BUSINESS_GOAL_NAMES, BusinessGoalType))
+_GOAL_BY_NAME = dict(_GOAL_ITEMS)
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class BrandFoundationConfig:
     """
     Core configuration for brand analysis.
 
     This is the primary input that drives the entire framework.
+    Instances are immutable and hashable, so sequence fields are tuples
+    and business goals are a combined BusinessGoalType flag.
     """
     brand_name: str
     primary_niche: str
-    business_goals: list[BusinessGoalType]
+    business_goals: BusinessGoalType
     source_mode: SourceMode = SourceMode.SEED
     sitemap_url: str | None = None
-    seed_entities: list[str] = field(default_factory=list)
-    competitors: list[str] = field(default_factory=list)
-    target_regions: list[str] = field(default_factory=lambda: ["US"])
-    target_languages: list[str] = field(default_factory=lambda: ["en"])
-
-    def validate(self) -> list[str]:
-        """Validate configuration and return list of errors."""
-        errors = []
-        if not self.brand_name.strip():
-            errors.append("Brand name is required")
-        if not self.primary_niche.strip():
-            errors.append("Primary niche is required")
-        if not self.business_goals:
-            errors.append("At least one business goal is required")
-        if self.source_mode == SourceMode.SITEMAP and not self.sitemap_url:
-            errors.append("Sitemap URL required when source_mode is 'sitemap'")
-        if self.source_mode == SourceMode.SEED and not self.seed_entities:
-            errors.append("Seed entities required when source_mode is 'seed'")
-        return errors
+    seed_entities: tuple[str, ...] = ()
+    competitors: tuple[str, ...] = ()
+    target_regions: tuple[str, ...] = _DEFAULT_REGIONS
+    target_languages: tuple[str, ...] = _DEFAULT_LANGUAGES
+    fingerprint: bytes = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Stable 16-byte digest of the inputs, used to key downstream caches.
+        # The config is frozen, so it is computed once here.
+        inputs = {f.name: getattr(self, f.name) for f in fields(self) if f.init}
+        payload = json.dumps(inputs, sort_keys=True, default=str).encode()
+        object.__setattr__(self, "fingerprint", hashlib.blake2b(payload, digest_size=16).digest())
+
+    def validate(self, fast: bool = False) -> list[str]:
+        """
+        Validate configuration and return list of errors.
+
+        With ``fast=True`` checking stops at the first error, for callers
+        that only need to know whether the config is valid.
+        """
+        errors = _config_errors(self)
+        return list(islice(errors, 1) if fast else errors)
+
+
+def _config_errors(config: BrandFoundationConfig) -> Iterator[str]:
+    """Yield validation errors for a config in check order."""
+    if not config.brand_name or config.brand_name.isspace():
+        yield "Brand name is required"
+    if not config.primary_niche or config.primary_niche.isspace():
+        yield "Primary niche is required"
+    if not config.business_goals:
+        yield "At least one business goal is required"
+    if config.source_mode is SourceMode.SITEMAP and not config.sitemap_url:
+        yield "Sitemap URL required when source_mode is 'sitemap'"
+    if config.source_mode is SourceMode.SEED and not config.seed_entities:
+        yield "Seed entities required when source_mode is 'seed'"
 
 
 # Default relationship types for ontology mapping
@@ -403,3 +455,38 @@ DEFAULT_MEASUREMENT_KPIS = {
         "priority": "medium",
     },
 }
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert a template to read-only mappings and tuples with interned strings."""
+    if isinstance(value, dict):
+        return MappingProxyType({sys.intern(k): _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+
+# Templates are shared process-wide, so expose them read-only. Interning also
+# leaves one object per repeated name (intents, formats, schema types) across
+# tables, the same one IntentType values and HubPage formats point at.
+DEFAULT_RELATIONSHIP_TYPES = _freeze(DEFAULT_RELATIONSHIP_TYPES)
+DEFAULT_INTENT_TYPES = _freeze(DEFAULT_INTENT_TYPES)
+DEFAULT_CONTENT_FORMATS = _freeze(DEFAULT_CONTENT_FORMATS)
+DEFAULT_SCHEMA_TYPES = _freeze(DEFAULT_SCHEMA_TYPES)
+QUERY_FANOUT_PATTERNS = _freeze(QUERY_FANOUT_PATTERNS)
+DEFAULT_PERSONA_TEMPLATES = _freeze(DEFAULT_PERSONA_TEMPLATES)
+DEFAULT_MEASUREMENT_KPIS = _freeze(DEFAULT_MEASUREMENT_KPIS)
+
+# Reverse indexes over the templates, so consumers look up instead of scanning
+SCHEMA_TYPES_BY_FORMAT = MappingProxyType({
+    name: fmt["schema_types"] for name, fmt in DEFAULT_CONTENT_FORMATS.items()
+})
+
+_personas_by_format: dict[str, tuple[str, ...]] = {}
+for _persona_key, _template in DEFAULT_PERSONA_TEMPLATES.items():
+    for _format in _template["preferred_formats"]:
+        _personas_by_format[_format] = _personas_by_format.get(_format, ()) + (_persona_key,)
+PERSONAS_BY_FORMAT = MappingProxyType(_personas_by_format)
+del _personas_by_format, _persona_key, _template, _format
@@ -1,12 +1,18 @@
 """Core modules implementing the 7-step AI Search Visibility Framework."""
 
-from .ontology_builder import OntologyBuilder
-from .entity_search import EntitySearchExpander
-from .taxonomy_builder import TaxonomyBuilder
-from .query_mapper import QueryMapper
-from .hub_designer import HubDesigner
-from .content_specs import ContentSpecGenerator
-from .measurement_setup import MeasurementSetup
+import importlib
+
+# Step classes are imported on first attribute access (PEP 562), so importing
+# one step module doesn't load the other six
+_LAZY = {
+    "OntologyBuilder": ".ontology_builder",
+    "EntitySearchExpander": ".entity_search",
+    "TaxonomyBuilder": ".taxonomy_builder",
+    "QueryMapper": ".query_mapper",
+    "HubDesigner": ".hub_designer",
+    "ContentSpecGenerator": ".content_specs",
+    "MeasurementSetup": ".measurement_setup",
+}
 
 __all__ = [
     "OntologyBuilder",
@@ -17,3 +23,11 @@ __all__ = [
     "ContentSpecGenerator",
     "MeasurementSetup",
 ]
+
+
+def __getattr__(name: str):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
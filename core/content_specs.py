@@ -5,16 +5,20 @@ Generates detailed content specifications with format recommendations,
 schema markup, persona alignment, and AI optimization notes.
 """
 
-import hashlib
-from typing import Any
+import re
+import sys
+from collections import Counter
+from itertools import chain
+from types import MappingProxyType
+from typing import Any, Mapping
 
 from config.templates import (
     DEFAULT_CONTENT_FORMATS,
     DEFAULT_SCHEMA_TYPES,
     DEFAULT_PERSONA_TEMPLATES,
+    PERSONAS_BY_FORMAT,
 )
 from utils.data_models import (
-    Entity,
     Ontology,
     ContentHub,
     HubPage,
@@ -24,6 +28,191 @@ from utils.data_models import (
     ContentPriority,
 )
 
+# URL slug characters: everything else except whitespace is dropped
+_SLUG_KEEP = frozenset("abcdefghijklmnopqrstuvwxyz0123456789-")
+_SLUG_WS = re.compile(r"\s+")
+
+
+class _SlugTable(dict):
+    """str.translate table that deletes non-slug characters, filled lazily per code point."""
+
+    def __missing__(self, codepoint: int) -> int | None:
+        char = chr(codepoint)
+        value = codepoint if char in _SLUG_KEEP or char.isspace() else None
+        self[codepoint] = value
+        return value
+
+
+_SLUG_TABLE = _SlugTable()
+
+# Format assumed for pages without a recommended_format
+_DEFAULT_FORMAT = "long_form_guide"
+
+# Content structure templates by format; "{entity}" marks the entity name
+_STRUCTURES = {
+    "long_form_guide": (
+        "What is {entity}?",
+        "Key Features & Benefits",
+        "How It Works",
+        "Getting Started Guide",
+        "Best Practices",
+        "Common Challenges & Solutions",
+        "Advanced Tips",
+        "Frequently Asked Questions",
+        "Conclusion & Next Steps",
+    ),
+    "how_to_tutorial": (
+        "Overview & Prerequisites",
+        "Step 1: Initial Setup",
+        "Step 2: Configuration",
+        "Step 3: Implementation",
+        "Step 4: Testing & Validation",
+        "Troubleshooting Common Issues",
+        "Next Steps",
+    ),
+    "comparison_table": (
+        "Quick Comparison Overview",
+        "Feature-by-Feature Comparison",
+        "Pricing Comparison",
+        "Pros & Cons Summary",
+        "Use Case Recommendations",
+        "Our Verdict",
+    ),
+    "faq_page": (
+        "Most Common {entity} Questions",
+        "Getting Started FAQs",
+        "Technical FAQs",
+        "Pricing & Plans FAQs",
+        "Troubleshooting FAQs",
+    ),
+    "product_review": (
+        "Product Overview",
+        "Key Features Tested",
+        "Performance Analysis",
+        "Pros & Cons",
+        "Pricing & Value",
+        "Alternatives to Consider",
+        "Final Verdict",
+    ),
+    "listicle": (
+        "Introduction",
+        "Top {entity} Options",
+        "How We Evaluated",
+        "Detailed Breakdown",
+        "Recommendations by Use Case",
+    ),
+    "case_study": (
+        "Executive Summary",
+        "The Challenge",
+        "The Solution",
+        "Implementation Details",
+        "Results & Metrics",
+        "Key Takeaways",
+    ),
+    "glossary_definition": (
+        "Definition",
+        "Key Concepts",
+        "How It Works",
+        "Examples",
+        "Related Terms",
+    ),
+}
+
+# Implementation notes per schema type, interned like the schema templates they annotate
+_SCHEMA_NOTES: Mapping[str, str] = MappingProxyType({
+    schema_type: sys.intern(note)
+    for schema_type, note in {
+        "Article": "Include author, datePublished, dateModified. Link to author Person schema.",
+        "HowTo": "Break into clear steps with step[].name and step[].text. Include time estimates.",
+        "FAQPage": "Each Q&A must be in mainEntity array with Question and acceptedAnswer.",
+        "Product": "Include offers with price, availability. Add aggregateRating if reviews exist.",
+        "Review": "Requires itemReviewed. Include reviewRating with ratingValue and bestRating.",
+        "VideoObject": "Include duration, thumbnailUrl, uploadDate. Add hasPart for chapters.",
+        "BreadcrumbList": "Reflect taxonomy hierarchy. Include position for each item.",
+        "ItemList": "Use for lists/rankings. Include itemListElement with position.",
+    }.items()
+})
+_DEFAULT_SCHEMA_NOTE = sys.intern("Implement according to schema.org specifications.")
+_ORGANIZATION_REQUIRED_FIELDS = ("name", "url", "logo")
+
+# AI optimization notes: base, per format, then E-E-A-T credibility notes
+_AI_BASE_NOTES = (
+    "Lead each section with the core answer (inverted pyramid structure)",
+    "Use clear, descriptive H2/H3 headings that can stand alone as context",
+    "Include a TL;DR or key takeaways section at the top",
+    "Chunk content into modular, self-contained sections",
+    "Use bullet points and numbered lists for extractable content",
+)
+
+_AI_FORMAT_NOTES = {
+    "how_to_tutorial": (
+        "Number each step clearly (Step 1, Step 2, etc.)",
+        "Include estimated time for each step",
+        "Add 'Prerequisites' section at the beginning",
+    ),
+    "comparison_table": (
+        "Use actual HTML tables for comparisons",
+        "Include clear verdict/recommendation",
+        "Add 'Best for' categorizations",
+    ),
+    "faq_page": (
+        "Answer questions in the first sentence",
+        "Keep answers concise but complete",
+        "Group related questions together",
+    ),
+    "long_form_guide": (
+        "Include a table of contents with anchor links",
+        "Add 'Quick Summary' section after introduction",
+        "Use definition boxes for key terms",
+    ),
+}
+
+_EEAT_NOTES = (
+    "Include author credentials and expertise signals",
+    "Add 'Last Updated' date and commit to quarterly reviews",
+    "Reference primary sources and link to authoritative external content",
+    "Include first-hand experience, original insights, or unique data",
+)
+
+# Impact factor labels, one per bit of the _estimate_impact mask
+_IMPACT_FACTORS = (
+    "high-priority topic",
+    "significant topic",
+    "pillar page (hub anchor)",
+    "commercial intent (conversion potential)",
+    "transactional intent (high conversion)",
+    "multiple query targets",
+)
+_PRIORITY_IMPACT_BITS = {ContentPriority.CRITICAL: 1 << 0, ContentPriority.HIGH: 1 << 1}
+
+
+class _ImpactTable(dict):
+    """Impact summaries keyed by factor bitmask, rendered once per mask on first use."""
+
+    def __missing__(self, mask: int) -> str:
+        factors = [label for bit, label in enumerate(_IMPACT_FACTORS) if mask >> bit & 1]
+        value = f"High impact: {', '.join(factors)}" if factors else "Standard visibility impact expected"
+        self[mask] = value
+        return value
+
+
+_IMPACT_TABLE = _ImpactTable()
+
+# Query modifiers typical for each persona
+_PERSONA_QUERY_MODIFIERS = {
+    "beginner": ("beginner", "basics", "introduction", "simple", "easy", "for dummies"),
+    "practitioner": ("best practices", "tips", "advanced", "professional", "efficient"),
+    "expert": ("enterprise", "scale", "optimization", "architecture", "deep dive"),
+    "decision_maker": ("roi", "comparison", "enterprise", "pricing", "case study"),
+}
+
+# Persona template keys that suit each search intent
+_PERSONAS_BY_INTENT: Mapping[IntentType, tuple[str, ...]] = MappingProxyType({
+    IntentType.INFORMATIONAL: ("beginner", "practitioner"),
+    IntentType.COMMERCIAL: ("decision_maker", "practitioner"),
+    IntentType.TRANSACTIONAL: ("decision_maker",),
+})
+
 
 class ContentSpecGenerator:
     """
@@ -37,6 +226,20 @@ class ContentSpecGenerator:
     - SERP feature targeting
     """
 
+    __slots__ = (
+        "ontology",
+        "content_hubs",
+        "brand_name",
+        "personas",
+        "specs",
+        "_hub_slug_cache",
+        "_entity_name_cache",
+        "_structure_cache",
+        "_persona_by_id",
+        "_persona_id_by_key",
+        "_priority_groups_cache",
+    )
+
     def __init__(
         self,
         ontology: Ontology,
@@ -48,6 +251,13 @@ class ContentSpecGenerator:
         self.brand_name = brand_name
         self.personas: list[Persona] = []
         self.specs: list[ContentSpec] = []
+        self._hub_slug_cache: dict[str, str] = {}
+        self._entity_name_cache: dict[str, str | None] = {}
+        self._structure_cache: dict[tuple[str, str], tuple[str, ...]] = {}
+        self._persona_by_id: dict[str, Persona] = {}
+        self._persona_id_by_key: dict[str, str] = {}
+        # (spec count, groups) from the last get_spec_by_priority() call
+        self._priority_groups_cache: tuple[int, dict[str, list[ContentSpec]]] | None = None
 
     def generate_all_specs(self) -> tuple[list[Persona], list[ContentSpec]]:
         """
@@ -71,6 +281,7 @@ class ContentSpecGenerator:
         """Create target audience personas."""
         for persona_key, template in DEFAULT_PERSONA_TEMPLATES.items():
             persona_id = f"persona_{persona_key}"
+            self._persona_id_by_key[persona_key] = persona_id
 
             self.personas.append(Persona(
                 id=persona_id,
@@ -83,15 +294,11 @@ class ContentSpecGenerator:
                 query_modifiers=self._get_persona_query_modifiers(persona_key),
             ))
 
+        self._persona_by_id = {p.id: p for p in self.personas}
+
     def _get_persona_query_modifiers(self, persona_key: str) -> list[str]:
         """Get query modifiers typical for a persona."""
-        modifiers = {
-            "beginner": ["beginner", "basics", "introduction", "simple", "easy", "for dummies"],
-            "practitioner": ["best practices", "tips", "advanced", "professional", "efficient"],
-            "expert": ["enterprise", "scale", "optimization", "architecture", "deep dive"],
-            "decision_maker": ["roi", "comparison", "enterprise", "pricing", "case study"],
-        }
-        return modifiers.get(persona_key, [])
+        return list(_PERSONA_QUERY_MODIFIERS.get(persona_key, ()))
 
     def _generate_page_spec(
         self,
@@ -101,6 +308,12 @@ class ContentSpecGenerator:
         """Generate detailed content specification for a page."""
         spec_id = f"spec_{page.id}"
 
+        # Resolve shared inputs once and pass them to the helpers
+        format_type = page.recommended_format or _DEFAULT_FORMAT
+        entity_name = self._entity_name(page.entity_ids[0]) if page.entity_ids else None
+        if entity_name is None:
+            entity_name = hub.name
+
         # Determine target personas based on page type and intents
         target_personas = self._match_personas(page)
 
@@ -108,16 +321,16 @@ class ContentSpecGenerator:
         primary_query = page.target_queries[0] if page.target_queries else page.title.lower()
 
         # Generate content structure
-        structure = self._generate_content_structure(page, hub)
+        structure = self._generate_content_structure(format_type, entity_name)
 
         # Generate schema markup
         schema_markup = self._generate_schema_markup(page, hub)
 
         # Generate AI optimization notes
-        ai_notes = self._generate_ai_optimization_notes(page)
+        ai_notes = self._generate_ai_optimization_notes(page.recommended_format)
 
         # Determine SERP feature targets
-        serp_targets = self._determine_serp_targets(page)
+        serp_targets = self._determine_serp_targets(page, format_type)
 
         # Generate internal link anchors
         link_anchors = self._generate_link_anchors(page, hub)
@@ -133,9 +346,9 @@ class ContentSpecGenerator:
             title=page.title,
             target_url=self._generate_target_url(page, hub),
             primary_query=primary_query,
-            secondary_queries=page.target_queries[1:5] if len(page.target_queries) > 1 else [],
+            secondary_queries=page.target_queries[1:5],  # [] when there's no second query
             target_personas=target_personas,
-            recommended_format=page.recommended_format or "long_form_guide",
+            recommended_format=format_type,
             content_structure=structure,
             schema_markup=schema_markup,
             ai_optimization_notes=ai_notes,
@@ -149,115 +362,33 @@ class ContentSpecGenerator:
 
     def _match_personas(self, page: HubPage) -> list[str]:
         """Match page to relevant personas."""
-        matched = []
-
-        for persona in self.personas:
-            # Check format match
-            if page.recommended_format in persona.preferred_formats:
-                matched.append(persona.id)
-                continue
-
-            # Check intent match
-            intent_persona_map = {
-                IntentType.INFORMATIONAL: ["beginner", "practitioner"],
-                IntentType.COMMERCIAL: ["decision_maker", "practitioner"],
-                IntentType.TRANSACTIONAL: ["decision_maker"],
-            }
+        persona_keys = set(PERSONAS_BY_FORMAT.get(page.recommended_format, ()))
+        for intent in page.target_intents:
+            persona_keys.update(_PERSONAS_BY_INTENT.get(intent, ()))
 
-            for intent in page.target_intents:
-                personas_for_intent = intent_persona_map.get(intent, [])
-                if persona.name.lower().replace(" ", "_") in personas_for_intent:
-                    if persona.id not in matched:
-                        matched.append(persona.id)
+        matched = [
+            persona_id for persona_key, persona_id in self._persona_id_by_key.items()
+            if persona_key in persona_keys
+        ]
 
-        return matched if matched else [self.personas[0].id]  # Default to first persona
+        return matched or [self.personas[0].id]  # Default to first persona
 
-    def _generate_content_structure(
-        self,
-        page: HubPage,
-        hub: ContentHub,
-    ) -> list[str]:
+    def _generate_content_structure(self, format_type: str, entity_name: str) -> list[str]:
         """Generate recommended content structure (H2/H3 sections)."""
-        format_type = page.recommended_format or "long_form_guide"
-
-        # Get entity for context
-        entity = None
-        if page.entity_ids:
-            entity = self.ontology.get_entity(page.entity_ids[0])
-
-        entity_name = entity.name if entity else hub.name
-
-        # Structure templates by format
-        structures = {
-            "long_form_guide": [
-                f"What is {entity_name}?",
-                "Key Features & Benefits",
-                "How It Works",
-                "Getting Started Guide",
-                "Best Practices",
-                "Common Challenges & Solutions",
-                "Advanced Tips",
-                "Frequently Asked Questions",
-                "Conclusion & Next Steps",
-            ],
-            "how_to_tutorial": [
-                "Overview & Prerequisites",
-                "Step 1: Initial Setup",
-                "Step 2: Configuration",
-                "Step 3: Implementation",
-                "Step 4: Testing & Validation",
-                "Troubleshooting Common Issues",
-                "Next Steps",
-            ],
-            "comparison_table": [
-                "Quick Comparison Overview",
-                "Feature-by-Feature Comparison",
-                "Pricing Comparison",
-                "Pros & Cons Summary",
-                "Use Case Recommendations",
-                "Our Verdict",
-            ],
-            "faq_page": [
-                f"Most Common {entity_name} Questions",
-                "Getting Started FAQs",
-                "Technical FAQs",
-                "Pricing & Plans FAQs",
-                "Troubleshooting FAQs",
-            ],
-            "product_review": [
-                "Product Overview",
-                "Key Features Tested",
-                "Performance Analysis",
-                "Pros & Cons",
-                "Pricing & Value",
-                "Alternatives to Consider",
-                "Final Verdict",
-            ],
-            "listicle": [
-                "Introduction",
-                f"Top {entity_name} Options",
-                "How We Evaluated",
-                "Detailed Breakdown",
-                "Recommendations by Use Case",
-            ],
-            "case_study": [
-                "Executive Summary",
-                "The Challenge",
-                "The Solution",
-                "Implementation Details",
-                "Results & Metrics",
-                "Key Takeaways",
-            ],
-            "glossary_definition": [
-                "Definition",
-                "Key Concepts",
-                "How It Works",
-                "Examples",
-                "Related Terms",
-            ],
-        }
-
-        return structures.get(format_type, structures["long_form_guide"])
+        key = (format_type, entity_name)
+        structure = self._structure_cache.get(key)
+        if structure is None:
+            template = _STRUCTURES.get(format_type, _STRUCTURES[_DEFAULT_FORMAT])
+            structure = tuple(section.replace("{entity}", entity_name) for section in template)
+            self._structure_cache[key] = structure
+        return list(structure)
+
+    def _entity_name(self, entity_id: str) -> str | None:
+        """Get an entity's name, caching the ontology lookup."""
+        if entity_id not in self._entity_name_cache:
+            entity = self.ontology.get_entity(entity_id)
+            self._entity_name_cache[entity_id] = entity.name if entity else None
+        return self._entity_name_cache[entity_id]
 
     def _generate_schema_markup(
         self,
@@ -270,10 +401,11 @@ class ContentSpecGenerator:
         for schema_type in page.schema_types:
             schema_config = DEFAULT_SCHEMA_TYPES.get(schema_type, {})
 
+            # Field lists are the frozen template tuples, shared across every page
             schema = {
                 "@type": schema_type,
-                "required_fields": schema_config.get("required_fields", []),
-                "recommended_fields": schema_config.get("recommended_fields", []),
+                "required_fields": schema_config.get("required_fields", ()),
+                "recommended_fields": schema_config.get("recommended_fields", ()),
                 "implementation_notes": self._get_schema_notes(schema_type, page),
             }
 
@@ -283,95 +415,40 @@ class ContentSpecGenerator:
         schemas.append({
             "@type": "Organization",
             "note": f"Reference {self.brand_name} organization entity",
-            "required_fields": ["name", "url", "logo"],
+            "required_fields": _ORGANIZATION_REQUIRED_FIELDS,
         })
 
         return schemas
 
     def _get_schema_notes(self, schema_type: str, page: HubPage) -> str:
         """Get implementation notes for a schema type."""
-        notes = {
-            "Article": "Include author, datePublished, dateModified. Link to author Person schema.",
-            "HowTo": "Break into clear steps with step[].name and step[].text. Include time estimates.",
-            "FAQPage": "Each Q&A must be in mainEntity array with Question and acceptedAnswer.",
-            "Product": "Include offers with price, availability. Add aggregateRating if reviews exist.",
-            "Review": "Requires itemReviewed. Include reviewRating with ratingValue and bestRating.",
-            "VideoObject": "Include duration, thumbnailUrl, uploadDate. Add hasPart for chapters.",
-            "BreadcrumbList": "Reflect taxonomy hierarchy. Include position for each item.",
-            "ItemList": "Use for lists/rankings. Include itemListElement with position.",
-        }
-        return notes.get(schema_type, "Implement according to schema.org specifications.")
+        return _SCHEMA_NOTES.get(schema_type, _DEFAULT_SCHEMA_NOTE)
 
-    def _generate_ai_optimization_notes(self, page: HubPage) -> list[str]:
+    def _generate_ai_optimization_notes(self, recommended_format: str | None) -> list[str]:
         """Generate AI-specific optimization recommendations."""
-        notes = [
-            "Lead each section with the core answer (inverted pyramid structure)",
-            "Use clear, descriptive H2/H3 headings that can stand alone as context",
-            "Include a TL;DR or key takeaways section at the top",
-            "Chunk content into modular, self-contained sections",
-            "Use bullet points and numbered lists for extractable content",
+        return [
+            *_AI_BASE_NOTES,
+            *_AI_FORMAT_NOTES.get(recommended_format, ()),
+            *_EEAT_NOTES,
         ]
 
-        # Format-specific notes
-        format_notes = {
-            "how_to_tutorial": [
-                "Number each step clearly (Step 1, Step 2, etc.)",
-                "Include estimated time for each step",
-                "Add 'Prerequisites' section at the beginning",
-            ],
-            "comparison_table": [
-                "Use actual HTML tables for comparisons",
-                "Include clear verdict/recommendation",
-                "Add 'Best for' categorizations",
-            ],
-            "faq_page": [
-                "Answer questions in the first sentence",
-                "Keep answers concise but complete",
-                "Group related questions together",
-            ],
-            "long_form_guide": [
-                "Include a table of contents with anchor links",
-                "Add 'Quick Summary' section after introduction",
-                "Use definition boxes for key terms",
-            ],
-        }
-
-        if page.recommended_format in format_notes:
-            notes.extend(format_notes[page.recommended_format])
-
-        # Add E-E-A-T notes for credibility
-        notes.extend([
-            "Include author credentials and expertise signals",
-            "Add 'Last Updated' date and commit to quarterly reviews",
-            "Reference primary sources and link to authoritative external content",
-            "Include first-hand experience, original insights, or unique data",
-        ])
-
-        return notes
-
-    def _determine_serp_targets(self, page: HubPage) -> list[str]:
+    def _determine_serp_targets(self, page: HubPage, format_type: str) -> list[str]:
         """Determine which SERP features to target."""
-        targets = []
-
-        format_config = DEFAULT_CONTENT_FORMATS.get(
-            page.recommended_format or "long_form_guide", {}
-        )
-        targets.extend(format_config.get("serp_features", []))
+        format_config = DEFAULT_CONTENT_FORMATS.get(format_type, {})
+        # Insertion-ordered dict as an ordered set: O(1) dedupe on insert
+        targets = dict.fromkeys(format_config.get("serp_features", ()))
 
         # Add based on intent
         for intent in page.target_intents:
-            if intent == IntentType.INFORMATIONAL:
-                if "featured_snippet" not in targets:
-                    targets.append("featured_snippet")
-                if "paa" not in targets:
-                    targets.append("paa")
-            elif intent == IntentType.COMMERCIAL:
-                if "paa" not in targets:
-                    targets.append("paa")
-            elif intent == IntentType.TRANSACTIONAL:
-                targets.append("site_links")
-
-        return list(dict.fromkeys(targets))  # Dedupe
+            if intent is IntentType.INFORMATIONAL:
+                targets["featured_snippet"] = None
+                targets["paa"] = None
+            elif intent is IntentType.COMMERCIAL:
+                targets["paa"] = None
+            elif intent is IntentType.TRANSACTIONAL:
+                targets["site_links"] = None
+
+        return list(targets)
 
     def _generate_link_anchors(
         self,
@@ -402,104 +479,73 @@ class ContentSpecGenerator:
         intents: list[IntentType],
     ) -> str:
         """Determine appropriate content tone."""
-        tones = []
-
+        # Use primary (first known) persona's tone
         for persona_id in persona_ids:
-            persona = next((p for p in self.personas if p.id == persona_id), None)
+            persona = self._persona_by_id.get(persona_id)
             if persona:
-                tones.append(persona.content_tone)
-
-        if not tones:
-            # Default based on intent
-            if IntentType.COMMERCIAL in intents or IntentType.TRANSACTIONAL in intents:
-                return "professional, persuasive, benefit-focused"
-            else:
-                return "educational, clear, helpful"
+                return persona.content_tone
 
-        # Combine tones
-        return tones[0]  # Use primary persona's tone
+        # Default based on intent
+        if IntentType.COMMERCIAL in intents or IntentType.TRANSACTIONAL in intents:
+            return "professional, persuasive, benefit-focused"
+        else:
+            return "educational, clear, helpful"
 
     def _generate_target_url(self, page: HubPage, hub: ContentHub) -> str:
         """Generate target URL for page."""
-        import re
-
         # Create slug from title
-        slug = page.title.lower()
-        slug = re.sub(r"[^a-z0-9\s-]", "", slug)
-        slug = re.sub(r"\s+", "-", slug)
-        slug = re.sub(r"-+", "-", slug).strip("-")
+        words = page.title.lower().translate(_SLUG_TABLE).split()
+        slug = "-".join(filter(None, "-".join(words).split("-")))
 
         # Add hub context for non-pillar pages
         if page.page_type == "pillar":
             return f"/{slug}/"
         else:
-            hub_slug = re.sub(r"[^a-z0-9\s-]", "", hub.name.lower())
-            hub_slug = re.sub(r"\s+", "-", hub_slug)
+            hub_slug = self._hub_slug_cache.get(hub.id)
+            if hub_slug is None:
+                hub_slug = _SLUG_WS.sub("-", hub.name.lower().translate(_SLUG_TABLE))
+                self._hub_slug_cache[hub.id] = hub_slug
             return f"/{hub_slug}/{slug}/"
 
     def _estimate_impact(self, page: HubPage, hub: ContentHub) -> str:
         """Estimate potential visibility impact."""
-        factors = []
-
-        # Priority impact
-        if page.priority == ContentPriority.CRITICAL:
-            factors.append("high-priority topic")
-        elif page.priority == ContentPriority.HIGH:
-            factors.append("significant topic")
-
-        # Page type impact
-        if page.page_type == "pillar":
-            factors.append("pillar page (hub anchor)")
-
-        # Intent impact
-        if IntentType.COMMERCIAL in page.target_intents:
-            factors.append("commercial intent (conversion potential)")
-        if IntentType.TRANSACTIONAL in page.target_intents:
-            factors.append("transactional intent (high conversion)")
-
-        # Query count impact
-        if len(page.target_queries) >= 5:
-            factors.append("multiple query targets")
-
-        if not factors:
-            return "Standard visibility impact expected"
-
-        return f"High impact: {', '.join(factors)}"
+        intents = page.target_intents
+        mask = (
+            _PRIORITY_IMPACT_BITS.get(page.priority, 0)
+            | (page.page_type == "pillar") << 2
+            | (IntentType.COMMERCIAL in intents) << 3
+            | (IntentType.TRANSACTIONAL in intents) << 4
+            | (len(page.target_queries) >= 5) << 5
+        )
+        return _IMPACT_TABLE[mask]
 
     def get_spec_by_priority(self) -> dict[str, list[ContentSpec]]:
-        """Group specs by priority."""
-        grouped: dict[str, list[ContentSpec]] = {
-            "critical": [],
-            "high": [],
-            "medium": [],
-            "low": [],
-        }
-
-        for spec in self.specs:
-            grouped[spec.priority.value].append(spec)
+        """Group specs by priority. Callers get fresh lists they may modify."""
+        if self._priority_groups_cache and self._priority_groups_cache[0] == len(self.specs):
+            grouped = self._priority_groups_cache[1]
+        else:
+            grouped = {
+                "critical": [],
+                "high": [],
+                "medium": [],
+                "low": [],
+            }
+            for spec in self.specs:
+                grouped[spec.priority.value].append(spec)
+            self._priority_groups_cache = (len(self.specs), grouped)
 
-        return grouped
+        return {priority: list(specs) for priority, specs in grouped.items()}
 
     def generate_content_calendar_data(self) -> list[dict[str, Any]]:
         """Generate data for content calendar planning."""
-        calendar_items = []
-
-        # Sort by priority
-        priority_order = {
-            ContentPriority.CRITICAL: 0,
-            ContentPriority.HIGH: 1,
-            ContentPriority.MEDIUM: 2,
-            ContentPriority.LOW: 3,
-        }
+        # Order by priority; grouping is a stable bucket pass over the specs
+        grouped = self.get_spec_by_priority()
+        sorted_specs = chain(grouped["critical"], grouped["high"], grouped["medium"], grouped["low"])
 
-        sorted_specs = sorted(
-            self.specs,
-            key=lambda s: priority_order.get(s.priority, 4),
-        )
-
-        for i, spec in enumerate(sorted_specs):
+        calendar_items = []
+        for i, spec in enumerate(sorted_specs, start=1):
             calendar_items.append({
-                "order": i + 1,
+                "order": i,
                 "title": spec.title,
                 "format": spec.recommended_format,
                 "word_count": spec.word_count_target,
@@ -513,22 +559,14 @@ class ContentSpecGenerator:
 
     def generate_spec_report(self) -> dict[str, Any]:
         """Generate comprehensive content specification report."""
-        by_priority = self.get_spec_by_priority()
-        by_format: dict[str, int] = {}
-        total_word_count = 0
-
-        for spec in self.specs:
-            fmt = spec.recommended_format
-            by_format[fmt] = by_format.get(fmt, 0) + 1
-            if spec.word_count_target:
-                total_word_count += spec.word_count_target
+        priority_counts = Counter(spec.priority for spec in self.specs)
 
         return {
             "total_specs": len(self.specs),
             "total_personas": len(self.personas),
-            "total_planned_words": total_word_count,
-            "by_priority": {k: len(v) for k, v in by_priority.items()},
-            "by_format": by_format,
+            "total_planned_words": sum(spec.word_count_target or 0 for spec in self.specs),
+            "by_priority": {priority.value: priority_counts[priority] for priority in ContentPriority},
+            "by_format": dict(Counter(spec.recommended_format for spec in self.specs)),
             "personas": [
                 {
                     "name": p.name,
@@ -539,6 +577,7 @@ class ContentSpecGenerator:
             ],
             "critical_content": [
                 {"title": s.title, "format": s.recommended_format, "impact": s.estimated_impact}
-                for s in by_priority.get("critical", [])
+                for s in self.specs
+                if s.priority is ContentPriority.CRITICAL
             ],
         }
@@ -5,10 +5,12 @@ Expands identified entities with synonyms, variants, and related terms
 to increase semantic surface area.
 """
 
+import heapq
 import re
+from types import MappingProxyType
 from typing import Any
 
-from utils.data_models import Entity, EntityType, Ontology
+from utils.data_models import Entity, Ontology
 
 
 class EntitySearchExpander:
@@ -20,32 +22,55 @@ class EntitySearchExpander:
     """
 
     # Common suffix/prefix patterns for expansion
-    SUFFIX_PATTERNS = {
-        "tool": ["tools", "software", "platform", "app", "application"],
-        "service": ["services", "solution", "solutions"],
-        "guide": ["guides", "tutorial", "tutorials", "how-to"],
-        "tips": ["tips", "advice", "best practices", "strategies"],
-        "review": ["reviews", "comparison", "vs", "alternatives"],
-    }
+    SUFFIX_PATTERNS = MappingProxyType({
+        "tool": ("tools", "software", "platform", "app", "application"),
+        "service": ("services", "solution", "solutions"),
+        "guide": ("guides", "tutorial", "tutorials", "how-to"),
+        "tips": ("tips", "advice", "best practices", "strategies"),
+        "review": ("reviews", "comparison", "vs", "alternatives"),
+    })
+
+    # Replacement suffixes per base suffix, without the base suffix itself
+    SUFFIX_REPLACEMENTS = MappingProxyType({
+        base_suffix: tuple(suffix for suffix in related if suffix != base_suffix)
+        for base_suffix, related in SUFFIX_PATTERNS.items()
+    })
+
+    # Common industry prefixes, with their trailing space for startswith()
+    INDUSTRY_PREFIXES = ("digital ", "online ", "cloud ", "modern ", "advanced ")
 
     # Intent modifiers that create query variants
-    INTENT_MODIFIERS = {
-        "informational": [
+    INTENT_MODIFIERS = MappingProxyType({
+        "informational": (
             "what is", "how to", "why", "guide to", "introduction to",
             "basics of", "understanding", "explained", "overview",
-        ],
-        "commercial": [
+        ),
+        "commercial": (
             "best", "top", "vs", "comparison", "alternatives to",
             "review", "pricing", "cost of", "free",
-        ],
-        "transactional": [
+        ),
+        "transactional": (
             "buy", "get", "download", "sign up for", "try",
             "demo", "free trial", "discount",
-        ],
-    }
+        ),
+    })
+
+    # One alternation per intent, so coverage checks are a single regex search
+    INTENT_MODIFIER_PATTERNS = MappingProxyType({
+        intent: re.compile("|".join(re.escape(mod) for mod in mods))
+        for intent, mods in INTENT_MODIFIERS.items()
+    })
+
+    # Leading modifiers per intent used to build semantic variants
+    SEMANTIC_VARIANT_MODIFIERS = tuple(
+        modifier
+        for mods in INTENT_MODIFIERS.values()
+        for modifier in mods[:3]  # Limit per intent
+        if not modifier.endswith(" ")
+    )
 
     # Common abbreviation expansions
-    ABBREVIATIONS = {
+    ABBREVIATIONS = MappingProxyType({
         "seo": "search engine optimization",
         "sem": "search engine marketing",
         "ppc": "pay per click",
@@ -62,10 +87,29 @@ class EntitySearchExpander:
         "kpi": "key performance indicator",
         "cms": "content management system",
         "crm": "customer relationship management",
-    }
+    })
+
+    # Uppercase letters that start a new word in a camelCase name
+    CAMEL_CASE_BOUNDARY = re.compile("([A-Z])")
+
+    # Reverse lookup, matched with one alternation over every expansion.
+    # Longest first, so an expansion wins over any shorter one it starts with
+    ABBREVIATION_BY_EXPANSION = MappingProxyType(
+        {expansion: abbr for abbr, expansion in ABBREVIATIONS.items()}
+    )
+    EXPANSION_PATTERN = re.compile(
+        "|".join(re.escape(exp) for exp in sorted(ABBREVIATION_BY_EXPANSION, key=len, reverse=True))
+    )
+
+    __slots__ = ("ontology", "_variant_cache", "_intent_coverage_cache", "_expanded_names")
 
     def __init__(self, ontology: Ontology):
         self.ontology = ontology
+        # id(entity) -> ((name, aliases) the result was computed from, result)
+        self._variant_cache: dict[int, tuple[tuple[str, tuple[str, ...]], tuple[str, ...]]] = {}
+        self._intent_coverage_cache: dict[int, tuple[tuple[str, tuple[str, ...]], dict[str, bool]]] = {}
+        # entity.id -> (entity, name it was last expanded under)
+        self._expanded_names: dict[str, tuple[Entity, str]] = {}
 
     def expand_all_entities(self) -> Ontology:
         """
@@ -75,7 +119,12 @@ class EntitySearchExpander:
             Updated ontology with expanded entities
         """
         for entity in self.ontology.entities:
+            # Generated variants depend only on the name, so re-runs skip unchanged entities
+            expanded = self._expanded_names.get(entity.id)
+            if expanded and expanded[0] is entity and expanded[1] == entity.name:
+                continue
             self._expand_entity(entity)
+            self._expanded_names[entity.id] = (entity, entity.name)
 
         return self.ontology
 
@@ -83,36 +132,35 @@ class EntitySearchExpander:
         """Expand a single entity with aliases and variants."""
         name_lower = entity.name.lower()
 
-        # Start with existing aliases
-        new_aliases = set(entity.aliases)
-
-        # Add abbreviation expansions
-        new_aliases.update(self._expand_abbreviations(name_lower))
-
-        # Add plural/singular variants
-        new_aliases.update(self._generate_number_variants(entity.name))
-
-        # Add hyphen/space variants
-        new_aliases.update(self._generate_format_variants(entity.name))
-
-        # Add common suffix variants
-        new_aliases.update(self._generate_suffix_variants(name_lower))
-
-        # Add industry-specific variants
-        new_aliases.update(self._generate_industry_variants(name_lower))
+        # Only existing aliases can be mixed-case copies of the name: the
+        # generated variants are either built from name_lower or differ from it
+        existing = {alias for alias in entity.aliases if alias.lower() != name_lower}
+
+        # Existing aliases plus abbreviation, plural/singular, hyphen/space,
+        # suffix and industry-specific variants, merged in one union
+        new_aliases = existing.union(
+            self._expand_abbreviations(name_lower),
+            self._generate_number_variants(name_lower),
+            self._generate_format_variants(entity.name, name_lower),
+            self._generate_suffix_variants(name_lower),
+            self._generate_industry_variants(name_lower),
+        )
 
-        # Filter and deduplicate
+        # Filter out short aliases and the name itself, cheapest test first
         new_aliases = {
             alias for alias in new_aliases
-            if alias and alias.lower() != name_lower and len(alias) >= 2
+            if len(alias) >= 2 and alias != name_lower
         }
 
-        entity.aliases = list(new_aliases)
+        # Sorted, so alias order (and the queries built from the first few)
+        # doesn't depend on set iteration order
+        entity.aliases = sorted(new_aliases)
+        self._variant_cache.pop(id(entity), None)
+        self._intent_coverage_cache.pop(id(entity), None)
 
-    def _expand_abbreviations(self, name: str) -> set[str]:
-        """Expand known abbreviations in entity name."""
+    def _expand_abbreviations(self, name_lower: str) -> set[str]:
+        """Expand known abbreviations in a lowercased entity name."""
         expansions = set()
-        name_lower = name.lower()
 
         # Check if entire name is an abbreviation
         if name_lower in self.ABBREVIATIONS:
@@ -127,16 +175,14 @@ class EntitySearchExpander:
                 expansions.add(" ".join(expanded_words))
 
         # Reverse: check if name matches an expansion
-        for abbr, expansion in self.ABBREVIATIONS.items():
-            if expansion.lower() in name_lower:
-                expansions.add(name_lower.replace(expansion.lower(), abbr))
+        for expansion in dict.fromkeys(self.EXPANSION_PATTERN.findall(name_lower)):
+            expansions.add(name_lower.replace(expansion, self.ABBREVIATION_BY_EXPANSION[expansion]))
 
         return expansions
 
-    def _generate_number_variants(self, name: str) -> set[str]:
-        """Generate singular/plural variants."""
+    def _generate_number_variants(self, name_lower: str) -> set[str]:
+        """Generate singular/plural variants of a lowercased name."""
         variants = set()
-        name_lower = name.lower()
 
         # Pluralization rules
         if name_lower.endswith("s") and not name_lower.endswith("ss"):
@@ -160,7 +206,7 @@ class EntitySearchExpander:
 
         return variants
 
-    def _generate_format_variants(self, name: str) -> set[str]:
+    def _generate_format_variants(self, name: str, name_lower: str) -> set[str]:
         """Generate hyphen/space/camelCase variants."""
         variants = set()
 
@@ -171,12 +217,10 @@ class EntitySearchExpander:
         elif " " in name:
             variants.add(name.replace(" ", "-"))
             variants.add(name.replace(" ", ""))  # Concatenated
-
-        # CamelCase detection and splitting
-        if not " " in name and not "-" in name:
-            # Split camelCase
-            split = re.sub("([A-Z])", r" \1", name).strip().lower()
-            if split != name.lower():
+        elif not name.islower():
+            # Split camelCase (an all-lowercase name has nothing to split)
+            split = self.CAMEL_CASE_BOUNDARY.sub(r" \1", name).strip().lower()
+            if split != name_lower:
                 variants.add(split)
                 variants.add(split.replace(" ", "-"))
 
@@ -186,12 +230,10 @@ class EntitySearchExpander:
         """Generate variants with common suffixes."""
         variants = set()
 
-        for base_suffix, related_suffixes in self.SUFFIX_PATTERNS.items():
+        for base_suffix, replacements in self.SUFFIX_REPLACEMENTS.items():
             if name.endswith(base_suffix):
                 base = name[:-len(base_suffix)]
-                for suffix in related_suffixes:
-                    if suffix != base_suffix:
-                        variants.add(base + suffix)
+                variants.update(base + suffix for suffix in replacements)
 
         return variants
 
@@ -199,15 +241,9 @@ class EntitySearchExpander:
         """Generate industry-specific variants."""
         variants = set()
 
-        # Add common industry prefixes
-        industry_prefixes = ["digital", "online", "cloud", "modern", "advanced"]
-        for prefix in industry_prefixes:
-            if name.startswith(prefix + " "):
-                # Remove prefix
-                variants.add(name[len(prefix) + 1:])
-            elif not any(name.startswith(p + " ") for p in industry_prefixes):
-                # Could add prefix, but be conservative
-                pass
+        # Remove a common industry prefix (each is one word, so it ends at the first space)
+        if name.startswith(self.INDUSTRY_PREFIXES):
+            variants.add(name.partition(" ")[2])
 
         return variants
 
@@ -218,16 +254,20 @@ class EntitySearchExpander:
         Returns list of terms that should appear in content
         targeting this entity.
         """
+        key = (entity.name, tuple(entity.aliases))
+        cached = self._variant_cache.get(id(entity))
+        if cached is not None and cached[0] == key:
+            return list(cached[1])
+
         variants = [entity.name] + entity.aliases
 
         # Add intent-modified variants
         name_lower = entity.name.lower()
-        for intent, modifiers in self.INTENT_MODIFIERS.items():
-            for modifier in modifiers[:3]:  # Limit per intent
-                if not modifier.endswith(" "):
-                    variants.append(f"{modifier} {name_lower}")
+        variants.extend(f"{modifier} {name_lower}" for modifier in self.SEMANTIC_VARIANT_MODIFIERS)
 
-        return list(dict.fromkeys(variants))  # Dedupe while preserving order
+        variants = tuple(dict.fromkeys(variants))  # Dedupe while preserving order
+        self._variant_cache[id(entity)] = (key, variants)
+        return list(variants)
 
     def get_semantic_surface_area(self, entity: Entity) -> dict[str, Any]:
         """
@@ -237,19 +277,26 @@ class EntitySearchExpander:
         """
         variants = self.generate_semantic_variants(entity)
 
+        key = (entity.name, tuple(entity.aliases))
+        cached = self._intent_coverage_cache.get(id(entity))
+        if cached is not None and cached[0] == key:
+            intent_coverage = cached[1]
+        else:
+            # Modifiers never contain newlines, so no match can span two variants
+            variant_text = "\n".join(variants).lower()
+            intent_coverage = {
+                intent: pattern.search(variant_text) is not None
+                for intent, pattern in self.INTENT_MODIFIER_PATTERNS.items()
+            }
+            self._intent_coverage_cache[id(entity)] = (key, intent_coverage)
+
         return {
             "entity_name": entity.name,
             "alias_count": len(entity.aliases),
             "total_variants": len(variants),
             "variants": variants[:20],  # Sample
             "coverage_score": min(1.0, len(variants) / 20),
-            "intent_coverage": {
-                intent: any(
-                    any(mod in v.lower() for mod in mods)
-                    for v in variants
-                )
-                for intent, mods in self.INTENT_MODIFIERS.items()
-            },
+            "intent_coverage": dict(intent_coverage),
         }
 
     def prioritize_entities(self) -> list[Entity]:
@@ -287,23 +334,28 @@ class EntitySearchExpander:
             List of gap analysis results
         """
         gaps = []
-        our_entities = {e.name.lower() for e in self.ontology.entities}
-        our_aliases = set()
-        for entity in self.ontology.entities:
-            our_aliases.update(a.lower() for a in entity.aliases)
-
-        our_coverage = our_entities | our_aliases
+        if not competitor_entities:
+            return gaps
 
-        if competitor_entities:
-            for comp_entity in competitor_entities:
-                comp_lower = comp_entity.lower()
-                if comp_lower not in our_coverage:
-                    gaps.append({
-                        "entity": comp_entity,
-                        "gap_type": "missing",
-                        "recommendation": f"Consider creating content covering '{comp_entity}'",
-                        "priority": "high" if len(comp_entity.split()) <= 3 else "medium",
-                    })
+        # Names and aliases we already cover, lowercased in one pass
+        our_coverage = set()
+        for entity in self.ontology.entities:
+            our_coverage.add(entity.name.lower())
+            our_coverage.update(map(str.lower, entity.aliases))
+
+        # Case-insensitive dedupe of the competitor list, keeping first spellings
+        competitors_by_key = {}
+        for comp_entity in competitor_entities:
+            competitors_by_key.setdefault(comp_entity.lower(), comp_entity)
+
+        for comp_lower, comp_entity in competitors_by_key.items():
+            if comp_lower not in our_coverage:
+                gaps.append({
+                    "entity": comp_entity,
+                    "gap_type": "missing",
+                    "recommendation": f"Consider creating content covering '{comp_entity}'",
+                    "priority": "high" if len(comp_entity.split()) <= 3 else "medium",
+                })
 
         return gaps
 
@@ -313,33 +365,33 @@ class EntitySearchExpander:
 
         Returns entities connected by relationships.
         """
-        cluster = []
         entity = self.ontology.get_entity(entity_id)
 
         if not entity:
-            return cluster
+            return []
 
-        cluster.append(entity)
+        # Keyed by entity ID, so each membership test is a hash lookup
+        # instead of a field-by-field model comparison against the whole list
+        cluster = {entity.id: entity}
 
         # Get related entities
         for related_entity, _ in self.ontology.get_related_entities(entity_id):
-            if related_entity not in cluster:
-                cluster.append(related_entity)
+            cluster.setdefault(related_entity.id, related_entity)
 
-        return cluster
+        return list(cluster.values())
 
     def generate_expansion_report(self) -> dict[str, Any]:
         """Generate report on entity expansion results."""
-        total_aliases = sum(len(e.aliases) for e in self.ontology.entities)
-        entities_with_aliases = sum(1 for e in self.ontology.entities if e.aliases)
-
+        total_aliases = 0
+        entities_with_aliases = 0
         by_type = {}
         for entity in self.ontology.entities:
-            type_key = entity.type.value
-            if type_key not in by_type:
-                by_type[type_key] = {"count": 0, "aliases": 0}
-            by_type[type_key]["count"] += 1
-            by_type[type_key]["aliases"] += len(entity.aliases)
+            alias_count = len(entity.aliases)
+            total_aliases += alias_count
+            entities_with_aliases += alias_count > 0
+            type_stats = by_type.setdefault(entity.type.value, {"count": 0, "aliases": 0})
+            type_stats["count"] += 1
+            type_stats["aliases"] += alias_count
 
         return {
             "total_entities": len(self.ontology.entities),
@@ -349,10 +401,6 @@ class EntitySearchExpander:
             "by_type": by_type,
             "top_expanded": [
                 {"name": e.name, "aliases": len(e.aliases)}
-                for e in sorted(
-                    self.ontology.entities,
-                    key=lambda x: len(x.aliases),
-                    reverse=True,
-                )[:10]
+                for e in heapq.nlargest(10, self.ontology.entities, key=lambda x: len(x.aliases))
             ],
         }
@@ -6,21 +6,53 @@ graphs for comprehensive topic coverage.
 """
 
 import hashlib
+from functools import lru_cache
+from itertools import islice
 from typing import Any
 
-from config.templates import DEFAULT_CONTENT_FORMATS
+from config.templates import SCHEMA_TYPES_BY_FORMAT
 from utils.data_models import (
     Entity,
     Ontology,
+    Relationship,
     Taxonomy,
     QueryCluster,
     ContentHub,
     HubPage,
     IntentType,
     ContentPriority,
+    EntityType,
 )
 
 
+# Query priorities that qualify for a pillar page's target queries
+_HIGH_PRIORITIES = frozenset({ContentPriority.CRITICAL, ContentPriority.HIGH})
+
+# One bit per search intent, so a hub's intent coverage is a single int
+_INTENT_BITS = {intent: 1 << bit for bit, intent in enumerate(IntentType)}
+
+# Gap priority for a hub missing each search intent
+_HIGH_PRIORITY_INTENTS = frozenset({IntentType.COMMERCIAL, IntentType.TRANSACTIONAL})
+_GAP_PRIORITY_BY_INTENT = {
+    intent: "high" if intent in _HIGH_PRIORITY_INTENTS else "medium"
+    for intent in IntentType
+}
+
+# Supporting page title by relationship type
+_REL_TITLE_TEMPLATES = {
+    "is_a": "{related}: A Type of {entity}",
+    "part_of": "{related} in {entity}",
+    "used_for": "Using {entity} for {related}",
+}
+_DEFAULT_REL_TITLE = "{related} & {entity}"
+
+
+@lru_cache(maxsize=4096)
+def _id_digest(entity_id: str) -> str:
+    """MD5 hex digest of an entity ID, computed once per ID; callers slice it into short tags."""
+    return hashlib.md5(entity_id.encode(), usedforsecurity=False).hexdigest()
+
+
 class HubDesigner:
     """
     Design topical content hubs with pillar-cluster architecture.
@@ -39,6 +71,75 @@ class HubDesigner:
         "supporting": 800,
     }
 
+    # Cluster pages per hub, in query pattern order
+    MAX_CLUSTER_PAGES = 10
+
+    # Visualization node size and color by page type
+    NODE_SIZES = {
+        "pillar": 40,
+        "cluster": 25,
+        "supporting": 15,
+    }
+    NODE_COLORS = {
+        "pillar": "#4CAF50",
+        "cluster": "#2196F3",
+        "supporting": "#FF9800",
+    }
+
+    # Cluster page title, format and intents per query pattern; "{entity}" marks the entity name
+    PATTERN_PAGE_CONFIGS = {
+        "definitional": (
+            "What is {entity}? Complete Overview",
+            "glossary_definition",
+            (IntentType.INFORMATIONAL,),
+        ),
+        "how_to": (
+            "How to Use {entity}: Step-by-Step Guide",
+            "how_to_tutorial",
+            (IntentType.INFORMATIONAL,),
+        ),
+        "comparison": (
+            "{entity} Alternatives & Comparisons",
+            "comparison_table",
+            (IntentType.COMMERCIAL,),
+        ),
+        "problems": (
+            "Common {entity} Problems & Solutions",
+            "faq_page",
+            (IntentType.INFORMATIONAL,),
+        ),
+        "benefits": (
+            "Benefits of {entity}: Why Use It?",
+            "listicle",
+            (IntentType.COMMERCIAL,),
+        ),
+        "examples": (
+            "{entity} Examples & Use Cases",
+            "case_study",
+            (IntentType.INFORMATIONAL,),
+        ),
+        "pricing": (
+            "{entity} Pricing & Plans",
+            "comparison_table",
+            (IntentType.TRANSACTIONAL, IntentType.COMMERCIAL),
+        ),
+        "reviews": (
+            "{entity} Review: Pros, Cons & Verdict",
+            "product_review",
+            (IntentType.COMMERCIAL,),
+        ),
+        "integration": (
+            "{entity} Integrations & APIs",
+            "how_to_tutorial",
+            (IntentType.INFORMATIONAL,),
+        ),
+        "advanced": (
+            "Advanced {entity} Tips & Best Practices",
+            "long_form_guide",
+            (IntentType.INFORMATIONAL,),
+        ),
+    }
+
     def __init__(
         self,
         ontology: Ontology,
@@ -50,6 +151,11 @@ class HubDesigner:
         self.query_clusters = query_clusters
         self.query_map = {qc.primary_entity_id: qc for qc in query_clusters}
         self.hubs: list[ContentHub] = []
+        # Ontology lookups cached for one design pass
+        self._entity_cache: dict[str, Entity | None] = {}
+        self._related_cache: dict[str, list[tuple[Entity, Relationship]]] = {}
+        # hub ID -> (page count when built, all_pages() list)
+        self._pages_cache: dict[str, tuple[int, list[HubPage]]] = {}
 
     def design_all_hubs(self) -> list[ContentHub]:
         """
@@ -58,6 +164,10 @@ class HubDesigner:
         Returns:
             List of designed content hubs
         """
+        self._entity_cache.clear()
+        self._related_cache.clear()
+        self._pages_cache.clear()
+
         # Create hubs for level-1 taxonomy nodes (main categories)
         for node in self.taxonomy.nodes:
             if node.level != 1:
@@ -67,7 +177,7 @@ class HubDesigner:
                 continue
 
             primary_entity_id = node.entity_ids[0]
-            entity = self.ontology.get_entity(primary_entity_id)
+            entity = self._entity(primary_entity_id)
 
             if not entity:
                 continue
@@ -86,7 +196,7 @@ class HubDesigner:
 
     def _design_hub(self, entity: Entity, taxonomy_node_id: str) -> ContentHub:
         """Design a content hub for an entity."""
-        hub_id = f"hub_{hashlib.md5(entity.id.encode()).hexdigest()[:8]}"
+        hub_id = f"hub_{_id_digest(entity.id)[:8]}"
 
         hub = ContentHub(
             id=hub_id,
@@ -124,11 +234,8 @@ class HubDesigner:
         target_queries = []
         if query_cluster:
             # Use high-priority queries
-            high_priority = [
-                q for q in query_cluster.queries
-                if q.priority in [ContentPriority.CRITICAL, ContentPriority.HIGH]
-            ]
-            target_queries = [q.query_text for q in high_priority[:5]]
+            high_priority = (q for q in query_cluster.queries if q.priority in _HIGH_PRIORITIES)
+            target_queries = [q.query_text for q in islice(high_priority, 5)]
 
         return HubPage(
             id=page_id,
@@ -156,15 +263,14 @@ class HubDesigner:
         # Group queries by fanout pattern
         by_pattern: dict[str, list] = {}
         for query in query_cluster.queries:
-            pattern = query.fanout_pattern or "general"
-            if pattern not in by_pattern:
-                by_pattern[pattern] = []
-            by_pattern[pattern].append(query)
+            by_pattern.setdefault(query.fanout_pattern or "general", []).append(query)
 
         # Create a cluster page for each significant pattern
         for pattern, queries in by_pattern.items():
             if len(queries) < 2:
                 continue
+            if len(cluster_pages) == self.MAX_CLUSTER_PAGES:
+                break
 
             page_id = f"{hub_id}_cluster_{pattern}"
 
@@ -174,17 +280,16 @@ class HubDesigner:
             )
 
             # Get schema types for this format
-            format_config = DEFAULT_CONTENT_FORMATS.get(format_type, {})
-            schema_types = format_config.get("schema_types", ["Article"])
+            schema_types = SCHEMA_TYPES_BY_FORMAT.get(format_type, ("Article",))
 
             # Determine priority based on query priorities
-            has_critical = any(q.priority == ContentPriority.CRITICAL for q in queries)
-            has_high = any(q.priority == ContentPriority.HIGH for q in queries)
-            priority = (
-                ContentPriority.CRITICAL if has_critical
-                else ContentPriority.HIGH if has_high
-                else ContentPriority.MEDIUM
-            )
+            priority = ContentPriority.MEDIUM
+            for q in queries:
+                if q.priority is ContentPriority.CRITICAL:
+                    priority = ContentPriority.CRITICAL
+                    break
+                if q.priority is ContentPriority.HIGH:
+                    priority = ContentPriority.HIGH
 
             cluster_pages.append(HubPage(
                 id=page_id,
@@ -200,7 +305,7 @@ class HubDesigner:
                 status="planned",
             ))
 
-        return cluster_pages[:10]  # Limit cluster pages per hub
+        return cluster_pages
 
     def _get_pattern_config(
         self,
@@ -208,63 +313,12 @@ class HubDesigner:
         entity_name: str,
     ) -> tuple[str, str, list[IntentType]]:
         """Get title, format, and intents for a pattern."""
-        configs = {
-            "definitional": (
-                f"What is {entity_name}? Complete Overview",
-                "glossary_definition",
-                [IntentType.INFORMATIONAL],
-            ),
-            "how_to": (
-                f"How to Use {entity_name}: Step-by-Step Guide",
-                "how_to_tutorial",
-                [IntentType.INFORMATIONAL],
-            ),
-            "comparison": (
-                f"{entity_name} Alternatives & Comparisons",
-                "comparison_table",
-                [IntentType.COMMERCIAL],
-            ),
-            "problems": (
-                f"Common {entity_name} Problems & Solutions",
-                "faq_page",
-                [IntentType.INFORMATIONAL],
-            ),
-            "benefits": (
-                f"Benefits of {entity_name}: Why Use It?",
-                "listicle",
-                [IntentType.COMMERCIAL],
-            ),
-            "examples": (
-                f"{entity_name} Examples & Use Cases",
-                "case_study",
-                [IntentType.INFORMATIONAL],
-            ),
-            "pricing": (
-                f"{entity_name} Pricing & Plans",
-                "comparison_table",
-                [IntentType.TRANSACTIONAL, IntentType.COMMERCIAL],
-            ),
-            "reviews": (
-                f"{entity_name} Review: Pros, Cons & Verdict",
-                "product_review",
-                [IntentType.COMMERCIAL],
-            ),
-            "integration": (
-                f"{entity_name} Integrations & APIs",
-                "how_to_tutorial",
-                [IntentType.INFORMATIONAL],
-            ),
-            "advanced": (
-                f"Advanced {entity_name} Tips & Best Practices",
-                "long_form_guide",
-                [IntentType.INFORMATIONAL],
-            ),
-        }
+        config = self.PATTERN_PAGE_CONFIGS.get(pattern)
+        if config is None:
+            return f"{entity_name}: {pattern.title()}", "long_form_guide", [IntentType.INFORMATIONAL]
 
-        return configs.get(
-            pattern,
-            (f"{entity_name}: {pattern.title()}", "long_form_guide", [IntentType.INFORMATIONAL]),
-        )
+        title_template, format_type, intents = config
+        return title_template.replace("{entity}", entity_name), format_type, list(intents)
 
     def _create_supporting_pages(
         self,
@@ -274,26 +328,19 @@ class HubDesigner:
         """Create supporting pages from related entities."""
         supporting_pages = []
 
-        # Get related entities
-        related = self.ontology.get_related_entities(entity.id)
-
-        for related_entity, relationship in related[:5]:
-            # Skip competitors
-            if related_entity.type.value == "competitor":
-                continue
+        # First five related entities, skipping competitors before the cap
+        related = (
+            pair for pair in self._related(entity.id)
+            if pair[0].type is not EntityType.COMPETITOR
+        )
 
-            page_id = f"{hub_id}_support_{hashlib.md5(related_entity.id.encode()).hexdigest()[:6]}"
+        for related_entity, relationship in islice(related, 5):
+            page_id = f"{hub_id}_support_{_id_digest(related_entity.id)[:6]}"
 
             # Title based on relationship
-            rel_type = relationship.relationship_type.value
-            if rel_type == "is_a":
-                title = f"{related_entity.name}: A Type of {entity.name}"
-            elif rel_type == "part_of":
-                title = f"{related_entity.name} in {entity.name}"
-            elif rel_type == "used_for":
-                title = f"Using {entity.name} for {related_entity.name}"
-            else:
-                title = f"{related_entity.name} & {entity.name}"
+            title = _REL_TITLE_TEMPLATES.get(
+                relationship.relationship_type.value, _DEFAULT_REL_TITLE
+            ).format(related=related_entity.name, entity=entity.name)
 
             supporting_pages.append(HubPage(
                 id=page_id,
@@ -313,80 +360,116 @@ class HubDesigner:
 
     def _map_internal_links(self, hub: ContentHub):
         """Map internal links within a hub."""
-        all_pages = hub.all_pages()
+        all_pages = self._pages(hub)
 
         if not hub.pillar_page:
             return
 
         pillar_id = hub.pillar_page.id
+        cluster_ids = [p.id for p in hub.cluster_pages]
 
         for page in all_pages:
             if page.id == pillar_id:
                 # Pillar links to all clusters
-                page.internal_links_to = [p.id for p in hub.cluster_pages]
+                page.internal_links_to = list(cluster_ids)
                 page.internal_links_from = []
             elif page.page_type == "cluster":
                 # Clusters link to pillar and related clusters
                 page.internal_links_to = [pillar_id]
                 page.internal_links_from = [pillar_id]
-                # Link to 2 other clusters
-                other_clusters = [
-                    p.id for p in hub.cluster_pages
-                    if p.id != page.id
-                ][:2]
-                page.internal_links_to.extend(other_clusters)
+                # Link to 2 other clusters, stopping once both are found
+                page.internal_links_to.extend(
+                    islice((cluster_id for cluster_id in cluster_ids if cluster_id != page.id), 2)
+                )
             else:
                 # Supporting pages link to pillar
                 page.internal_links_to = [pillar_id]
                 page.internal_links_from = []
 
+    def _entity(self, entity_id: str) -> Entity | None:
+        """Get an entity by ID, caching the ontology scan."""
+        if entity_id not in self._entity_cache:
+            self._entity_cache[entity_id] = self.ontology.get_entity(entity_id)
+        return self._entity_cache[entity_id]
+
+    def _related(self, entity_id: str) -> list[tuple[Entity, Relationship]]:
+        """Get an entity's related entities, caching the relationship walk."""
+        related = self._related_cache.get(entity_id)
+        if related is None:
+            related = self._related_cache[entity_id] = self.ontology.get_related_entities(entity_id)
+        return related
+
+    def _pages(self, hub: ContentHub) -> list[HubPage]:
+        """Get a hub's pages, reusing the list until pages are added or removed."""
+        page_count = hub.page_count
+        cached = self._pages_cache.get(hub.id)
+        if cached is None or cached[0] != page_count:
+            cached = self._pages_cache[hub.id] = (page_count, hub.all_pages())
+        return cached[1]
+
+    def _page_tallies(self, hub: ContentHub) -> tuple[int, int]:
+        """Targeted query count and bitmask of targeted intents across a hub's pages."""
+        query_count = 0
+        intent_mask = 0
+        for page in self._pages(hub):
+            query_count += len(page.target_queries)
+            for intent in page.target_intents:
+                intent_mask |= _INTENT_BITS[intent]
+        return query_count, intent_mask
+
     def _map_hub_links(self):
         """Map links between hubs."""
+        # First hub per primary entity, so each related-entity lookup is one dict hit
+        hub_by_entity: dict[str, ContentHub] = {}
+        for hub in self.hubs:
+            hub_by_entity.setdefault(hub.primary_entity_id, hub)
+
         # Link related hubs based on entity relationships
         for hub in self.hubs:
-            entity = self.ontology.get_entity(hub.primary_entity_id)
+            if not hub.pillar_page:
+                continue
+
+            entity = self._entity(hub.primary_entity_id)
             if not entity:
                 continue
 
-            related = self.ontology.get_related_entities(entity.id)
+            links = hub.pillar_page.internal_links_to
+            linked = set(links)
+
+            for related_entity, _ in self._related(entity.id):
+                other_hub = hub_by_entity.get(related_entity.id)
+                if not other_hub or not other_hub.pillar_page:
+                    continue
 
-            for related_entity, _ in related:
-                # Find hub for related entity
-                for other_hub in self.hubs:
-                    if other_hub.primary_entity_id == related_entity.id:
-                        # Link pillars
-                        if hub.pillar_page and other_hub.pillar_page:
-                            if other_hub.pillar_page.id not in hub.pillar_page.internal_links_to:
-                                hub.pillar_page.internal_links_to.append(
-                                    other_hub.pillar_page.id
-                                )
-                        break
+                # Link pillars
+                pillar_id = other_hub.pillar_page.id
+                if pillar_id not in linked:
+                    links.append(pillar_id)
+                    linked.add(pillar_id)
 
     def _calculate_coverage(self, hub: ContentHub) -> float:
         """Calculate coverage score for a hub."""
+        page_count = hub.page_count
+        if not page_count:
+            return 0.0
+
+        covered_queries, intent_mask = self._page_tallies(hub)
         scores = []
 
         # Query coverage
         query_cluster = self.query_map.get(hub.primary_entity_id)
         if query_cluster:
             total_queries = len(query_cluster.queries)
-            covered_queries = sum(
-                len(p.target_queries) for p in hub.all_pages()
-            )
             query_coverage = min(1.0, covered_queries / max(total_queries, 1))
             scores.append(query_coverage)
 
         # Intent coverage
-        all_intents = set(IntentType)
-        covered_intents = set()
-        for page in hub.all_pages():
-            covered_intents.update(page.target_intents)
-        intent_coverage = len(covered_intents) / len(all_intents)
+        intent_coverage = intent_mask.bit_count() / len(_INTENT_BITS)
         scores.append(intent_coverage)
 
         # Link density
         total_links = hub.internal_link_count
-        expected_links = len(hub.all_pages()) * 3
+        expected_links = page_count * 3
         link_coverage = min(1.0, total_links / max(expected_links, 1))
         scores.append(link_coverage)
 
@@ -397,55 +480,47 @@ class HubDesigner:
         nodes = []
         edges = []
 
-        for page in hub.all_pages():
+        for page in self._pages(hub):
             nodes.append({
                 "id": page.id,
                 "label": page.title[:30] + "..." if len(page.title) > 30 else page.title,
                 "type": page.page_type,
-                "size": {
-                    "pillar": 40,
-                    "cluster": 25,
-                    "supporting": 15,
-                }.get(page.page_type, 20),
-                "color": {
-                    "pillar": "#4CAF50",
-                    "cluster": "#2196F3",
-                    "supporting": "#FF9800",
-                }.get(page.page_type, "#9E9E9E"),
+                "size": self.NODE_SIZES.get(page.page_type, 20),
+                "color": self.NODE_COLORS.get(page.page_type, "#9E9E9E"),
             })
 
-            for target_id in page.internal_links_to:
-                edges.append({
-                    "source": page.id,
-                    "target": target_id,
-                })
+            page_id = page.id
+            edges.extend(
+                {"source": page_id, "target": target_id}
+                for target_id in page.internal_links_to
+            )
 
         return {"nodes": nodes, "edges": edges}
 
     def suggest_content_gaps(self) -> list[dict[str, Any]]:
         """Identify content gaps across all hubs."""
-        gaps = []
+        # High-priority gaps first, each group in discovery order
+        high_priority_gaps = []
+        other_gaps = []
 
         for hub in self.hubs:
-            # Check intent coverage
-            covered_intents = set()
-            for page in hub.all_pages():
-                covered_intents.update(page.target_intents)
-
-            missing_intents = set(IntentType) - covered_intents
-
-            for intent in missing_intents:
-                gaps.append({
+            # Check intent coverage, in IntentType order
+            _, covered_mask = self._page_tallies(hub)
+            for intent, bit in _INTENT_BITS.items():
+                if covered_mask & bit:
+                    continue
+                priority = _GAP_PRIORITY_BY_INTENT[intent]
+                (high_priority_gaps if priority == "high" else other_gaps).append({
                     "hub_name": hub.name,
                     "gap_type": "missing_intent",
                     "intent": intent.value,
                     "recommendation": f"Create content targeting {intent.value} intent for {hub.name}",
-                    "priority": "high" if intent in [IntentType.COMMERCIAL, IntentType.TRANSACTIONAL] else "medium",
+                    "priority": priority,
                 })
 
             # Check for thin hubs
             if len(hub.cluster_pages) < 3:
-                gaps.append({
+                other_gaps.append({
                     "hub_name": hub.name,
                     "gap_type": "thin_hub",
                     "cluster_count": len(hub.cluster_pages),
@@ -453,40 +528,46 @@ class HubDesigner:
                     "priority": "medium",
                 })
 
-        return sorted(gaps, key=lambda x: x.get("priority", "low") == "high", reverse=True)
+        return high_priority_gaps + other_gaps
 
     def generate_hub_report(self) -> dict[str, Any]:
         """Generate comprehensive hub design report."""
-        total_pages = sum(len(h.all_pages()) for h in self.hubs)
-        total_links = sum(h.internal_link_count for h in self.hubs)
-
+        total_links = 0
         page_type_counts = {"pillar": 0, "cluster": 0, "supporting": 0}
+        coverage_scores = {}
+        hub_details = []
+
         for hub in self.hubs:
+            cluster_count = len(hub.cluster_pages)
+            supporting_count = len(hub.supporting_pages)
+            coverage = round(hub.coverage_score, 2)
+
+            total_links += hub.internal_link_count
             if hub.pillar_page:
                 page_type_counts["pillar"] += 1
-            page_type_counts["cluster"] += len(hub.cluster_pages)
-            page_type_counts["supporting"] += len(hub.supporting_pages)
+            page_type_counts["cluster"] += cluster_count
+            page_type_counts["supporting"] += supporting_count
+            coverage_scores[hub.name] = coverage
+            hub_details.append({
+                "name": hub.name,
+                "pillar": hub.pillar_page.title if hub.pillar_page else None,
+                "cluster_count": cluster_count,
+                "supporting_count": supporting_count,
+                "link_count": hub.internal_link_count,
+                "coverage": coverage,
+            })
+
+        total_pages = sum(page_type_counts.values())
+        hub_count = len(self.hubs)
 
         return {
-            "total_hubs": len(self.hubs),
+            "total_hubs": hub_count,
             "total_pages": total_pages,
             "total_internal_links": total_links,
-            "avg_pages_per_hub": total_pages / len(self.hubs) if self.hubs else 0,
-            "avg_links_per_hub": total_links / len(self.hubs) if self.hubs else 0,
+            "avg_pages_per_hub": total_pages / hub_count if hub_count else 0,
+            "avg_links_per_hub": total_links / hub_count if hub_count else 0,
             "page_type_distribution": page_type_counts,
-            "coverage_scores": {
-                hub.name: round(hub.coverage_score, 2) for hub in self.hubs
-            },
+            "coverage_scores": coverage_scores,
             "content_gaps": self.suggest_content_gaps()[:10],
-            "hub_details": [
-                {
-                    "name": hub.name,
-                    "pillar": hub.pillar_page.title if hub.pillar_page else None,
-                    "cluster_count": len(hub.cluster_pages),
-                    "supporting_count": len(hub.supporting_pages),
-                    "link_count": hub.internal_link_count,
-                    "coverage": round(hub.coverage_score, 2),
-                }
-                for hub in self.hubs
-            ],
+            "hub_details": hub_details,
         }
@@ -5,7 +5,6 @@ Configures KPIs, tracking setup, content audit framework,
 and refresh cadence for ongoing AI visibility monitoring.
 """
 
-from datetime import datetime
 from typing import Any
 
 from config.templates import DEFAULT_MEASUREMENT_KPIS
@@ -18,6 +17,7 @@ from utils.data_models import (
     KPI,
     ContentAuditItem,
     ContentPriority,
+    EntityType,
 )
 
 
@@ -41,6 +41,37 @@ class MeasurementSetup:
         "evergreen": "annually",
     }
 
+    # Update actions recommended for every audited page
+    BASE_UPDATES = (
+        "Review and update statistics/data points",
+        "Verify all external links are working",
+        "Update 'Last Modified' date in schema",
+    )
+
+    # Additional update actions by content format
+    FORMAT_UPDATES = {
+        "comparison_table": (
+            "Update pricing information",
+            "Check for new competitors/alternatives",
+            "Refresh feature comparisons",
+        ),
+        "how_to_tutorial": (
+            "Verify steps still work with latest versions",
+            "Update screenshots if UI changed",
+            "Add new tips based on user feedback",
+        ),
+        "product_review": (
+            "Update product version information",
+            "Refresh pros/cons based on changes",
+            "Update rating if warranted",
+        ),
+        "long_form_guide": (
+            "Add new sections for emerging topics",
+            "Update examples with recent cases",
+            "Refresh internal links to new content",
+        ),
+    }
+
     def __init__(
         self,
         ontology: Ontology,
@@ -55,7 +86,7 @@ class MeasurementSetup:
         self.content_hubs = content_hubs
         self.content_specs = content_specs
         self.brand_name = brand_name
-        self.competitors = competitors or []
+        self.competitors = list(competitors or ())
 
     def create_measurement_plan(self) -> MeasurementPlan:
         """
@@ -153,14 +184,13 @@ class MeasurementSetup:
                 f"how to {entity_lower}",
             ])
 
-        # High-priority queries from clusters
+        # High-priority queries from clusters (duplicates drop out below)
         for cluster in self.query_clusters:
             for query in cluster.queries:
-                if query.priority in [ContentPriority.CRITICAL, ContentPriority.HIGH]:
-                    if query.query_text not in queries:
-                        queries.append(query.query_text)
+                if query.priority is ContentPriority.CRITICAL or query.priority is ContentPriority.HIGH:
+                    queries.append(query.query_text)
 
-        # Dedupe and limit
+        # Dedupe (case-insensitive, first occurrence wins) and limit
         seen = set()
         unique_queries = []
         for q in queries:
@@ -182,7 +212,7 @@ class MeasurementSetup:
             # Time-sensitive formats need more frequent updates
             time_sensitive_formats = ["comparison_table", "product_review", "listicle"]
             if spec.recommended_format in time_sensitive_formats:
-                if update_priority == ContentPriority.MEDIUM:
+                if update_priority is ContentPriority.MEDIUM:
                     update_priority = ContentPriority.HIGH
 
             audit_items.append(ContentAuditItem(
@@ -199,41 +229,10 @@ class MeasurementSetup:
 
     def _get_recommended_updates(self, spec: ContentSpec) -> list[str]:
         """Get recommended update actions for a content spec."""
-        updates = []
-
-        # Base updates for all content
-        updates.append("Review and update statistics/data points")
-        updates.append("Verify all external links are working")
-        updates.append("Update 'Last Modified' date in schema")
-
-        # Format-specific updates
-        format_updates = {
-            "comparison_table": [
-                "Update pricing information",
-                "Check for new competitors/alternatives",
-                "Refresh feature comparisons",
-            ],
-            "how_to_tutorial": [
-                "Verify steps still work with latest versions",
-                "Update screenshots if UI changed",
-                "Add new tips based on user feedback",
-            ],
-            "product_review": [
-                "Update product version information",
-                "Refresh pros/cons based on changes",
-                "Update rating if warranted",
-            ],
-            "long_form_guide": [
-                "Add new sections for emerging topics",
-                "Update examples with recent cases",
-                "Refresh internal links to new content",
-            ],
-        }
-
-        if spec.recommended_format in format_updates:
-            updates.extend(format_updates[spec.recommended_format])
-
-        return updates
+        return [
+            *self.BASE_UPDATES,
+            *self.FORMAT_UPDATES.get(spec.recommended_format, ()),
+        ]
 
     def _create_refresh_schedule(self) -> dict[str, str]:
         """Create content refresh schedule by content type."""
@@ -275,7 +274,7 @@ class MeasurementSetup:
                     "queries": [q.query_text for q in high_priority_queries[:5]],
                     "intent_distribution": cluster.intent_distribution,
                     "monitoring_priority": (
-                        "critical" if any(q.priority == ContentPriority.CRITICAL for q in high_priority_queries)
+                        "critical" if any(q.priority is ContentPriority.CRITICAL for q in high_priority_queries)
                         else "high"
                     ),
                 })
@@ -322,7 +321,7 @@ class MeasurementSetup:
 
         # Add entity-specific prompts
         top_entities = sorted(
-            [e for e in self.ontology.entities if e.type.value == "core"],
+            [e for e in self.ontology.entities if e.type is EntityType.CORE],
             key=lambda e: e.semantic_centrality,
             reverse=True,
         )[:5]
@@ -396,7 +395,7 @@ class MeasurementSetup:
         # High-priority content without coverage
         critical_specs = [
             s for s in self.content_specs
-            if s.priority == ContentPriority.CRITICAL
+            if s.priority is ContentPriority.CRITICAL
         ]
 
         if critical_specs:
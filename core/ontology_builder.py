@@ -7,11 +7,12 @@ to create a comprehensive brand ontology.
 
 import re
 import hashlib
+from bisect import bisect_right
+from functools import lru_cache
 from typing import Any
 
 from config.templates import (
     BrandFoundationConfig,
-    DEFAULT_RELATIONSHIP_TYPES,
     SourceMode,
 )
 from utils.data_models import (
@@ -24,6 +25,20 @@ from utils.data_models import (
 from utils.sitemap_parser import SitemapParser
 
 
+_SLUG_PATTERN = re.compile(r"[^a-z0-9]+")
+
+# Words too common to relate two entity names on their own
+_STOPWORDS = frozenset({"the", "a", "an", "and", "or", "for", "of", "in"})
+
+
+@lru_cache(maxsize=4096)
+def _entity_id(normalized: str) -> str:
+    """Entity ID for an already lowercased and stripped name, computed once per name."""
+    hash_suffix = hashlib.md5(normalized.encode(), usedforsecurity=False).hexdigest()[:8]
+    slug = _SLUG_PATTERN.sub("_", normalized)[:30]
+    return f"{slug}_{hash_suffix}"
+
+
 class OntologyBuilder:
     """
     Build brand ontology from seed entities or sitemap extraction.
@@ -47,9 +62,9 @@ class OntologyBuilder:
             Ontology with entities and relationships
         """
         # Extract entities based on source mode
-        if self.config.source_mode == SourceMode.SITEMAP:
+        if self.config.source_mode is SourceMode.SITEMAP:
             self._extract_from_sitemap()
-        elif self.config.source_mode == SourceMode.SEED:
+        elif self.config.source_mode is SourceMode.SEED:
             self._create_from_seeds()
         else:  # HYBRID
             self._create_from_seeds()
@@ -73,10 +88,7 @@ class OntologyBuilder:
 
     def _generate_entity_id(self, name: str) -> str:
         """Generate unique entity ID from name."""
-        normalized = name.lower().strip()
-        hash_suffix = hashlib.md5(normalized.encode()).hexdigest()[:8]
-        slug = re.sub(r"[^a-z0-9]+", "_", normalized)[:30]
-        return f"{slug}_{hash_suffix}"
+        return _entity_id(name.lower().strip())
 
     def _add_brand_entity(self):
         """Add brand as the root entity."""
@@ -88,7 +100,7 @@ class OntologyBuilder:
             description=f"Primary brand entity for {self.config.brand_name}",
             attributes={
                 "niche": self.config.primary_niche,
-                "goals": [g.value for g in self.config.business_goals],
+                "goals": list(self.config.business_goals.to_strings()),
             },
             commercial_value=1.0,
             semantic_centrality=1.0,
@@ -196,7 +208,7 @@ class OntologyBuilder:
                 continue
 
             # Connect all core entities to brand
-            if entity.type == EntityType.CORE:
+            if entity.type is EntityType.CORE:
                 self.relationships.append(Relationship(
                     source_id=entity.id,
                     target_id=brand_id,
@@ -206,7 +218,7 @@ class OntologyBuilder:
                 ))
 
             # Connect competitors with alternative_to relationship
-            if entity.type == EntityType.COMPETITOR:
+            if entity.type is EntityType.COMPETITOR:
                 self.relationships.append(Relationship(
                     source_id=entity.id,
                     target_id=brand_id,
@@ -216,18 +228,59 @@ class OntologyBuilder:
                     context="Competitor relationship",
                 ))
 
-        # Infer relationships between entities based on name similarity
-        for i, entity1 in enumerate(entity_list):
-            for entity2 in entity_list[i + 1:]:
-                relationship = self._detect_relationship(entity1, entity2)
-                if relationship:
-                    self.relationships.append(relationship)
-
-    def _detect_relationship(self, e1: Entity, e2: Entity) -> Relationship | None:
-        """Detect potential relationship between two entities."""
-        name1 = e1.name.lower()
-        name2 = e2.name.lower()
-
+        # Infer relationships between entities based on name similarity,
+        # checking only pairs that share a term or where one name contains the other
+        names = [entity.name.lower() for entity in entity_list]
+        words = [set(name.split()) for name in names]
+
+        candidates: set[tuple[int, int]] = set()
+        postings: dict[str, list[int]] = {}
+        for i, name_words in enumerate(words):
+            for word in name_words - _STOPWORDS:
+                postings.setdefault(word, []).append(i)
+        for indices in postings.values():
+            for k, i in enumerate(indices):
+                candidates.update((i, j) for j in indices[k + 1:])
+        candidates.update(self._containment_pairs(names))
+
+        # Pairs in list order, so relationships are appended as a full pairwise scan would
+        for i, j in sorted(candidates):
+            relationship = self._detect_relationship(
+                entity_list[i], entity_list[j], names[i], names[j], words[i], words[j]
+            )
+            if relationship:
+                self.relationships.append(relationship)
+
+    def _containment_pairs(self, names: list[str]) -> set[tuple[int, int]]:
+        """Index pairs (i, j), i < j, where one lowercased name occurs inside the other."""
+        # Search every name within all names at once instead of testing each pair
+        starts = []
+        offset = 0
+        for name in names:
+            starts.append(offset)
+            offset += len(name) + 1
+        haystack = "\0".join(names)
+
+        pairs = set()
+        for i, name in enumerate(names):
+            pos = haystack.find(name)
+            while pos != -1:
+                j = bisect_right(starts, pos) - 1
+                if j != i and pos + len(name) <= starts[j] + len(names[j]):
+                    pairs.add((i, j) if i < j else (j, i))
+                pos = haystack.find(name, pos + 1)
+        return pairs
+
+    def _detect_relationship(
+        self,
+        e1: Entity,
+        e2: Entity,
+        name1: str,
+        name2: str,
+        words1: set[str],
+        words2: set[str],
+    ) -> Relationship | None:
+        """Detect potential relationship between two entities from their lowercased names and words."""
         # Check if one contains the other (potential is_a or part_of)
         if name1 in name2 and name1 != name2:
             return Relationship(
@@ -247,11 +300,9 @@ class OntologyBuilder:
             )
 
         # Check for word overlap (relates_to)
-        words1 = set(name1.split())
-        words2 = set(name2.split())
-        common = words1 & words2 - {"the", "a", "an", "and", "or", "for", "of", "in"}
+        common = words1 & words2 - _STOPWORDS
 
-        if common and len(common) >= 1:
+        if common:
             return Relationship(
                 source_id=e1.id,
                 target_id=e2.id,
@@ -281,11 +332,11 @@ class OntologyBuilder:
             entity.semantic_centrality = min(1.0, rel_count / max_rels + 0.2)
 
             # Commercial value based on entity type
-            if entity.type == EntityType.CORE:
+            if entity.type is EntityType.CORE:
                 entity.commercial_value = 0.8
-            elif entity.type == EntityType.SUPPORTING:
+            elif entity.type is EntityType.SUPPORTING:
                 entity.commercial_value = 0.4
-            elif entity.type == EntityType.COMPETITOR:
+            elif entity.type is EntityType.COMPETITOR:
                 entity.commercial_value = 0.3
             else:
                 entity.commercial_value = 0.5
@@ -6,9 +6,10 @@ and anticipates query rewrites for comprehensive intent coverage.
 """
 
 import hashlib
+from collections import Counter
 from typing import Any
 
-from config.templates import QUERY_FANOUT_PATTERNS, DEFAULT_INTENT_TYPES
+from config.templates import QUERY_FANOUT_PATTERNS
 from utils.data_models import (
     Entity,
     Ontology,
@@ -16,6 +17,26 @@ from utils.data_models import (
     QueryCluster,
     IntentType,
     ContentPriority,
+    EntityType,
+)
+
+# Fan-out pattern priority levels mapped to content priority
+_PRIORITY_BY_LEVEL = {1: ContentPriority.CRITICAL, 2: ContentPriority.HIGH, 3: ContentPriority.MEDIUM}
+
+# Fan-out groups resolved once at import as (name, intent, priority, templates).
+# Each template is its pattern split on "{entity}", so the entity name fills
+# the placeholder with a join instead of a replace per query.
+_FANOUT_TEMPLATES = tuple(
+    (
+        pattern_name,
+        IntentType(pattern_config["intent"]),
+        _PRIORITY_BY_LEVEL.get(pattern_config["priority"], ContentPriority.MEDIUM),
+        tuple(
+            tuple(pattern.split("{entity}"))
+            for pattern in pattern_config["patterns"][:3]  # Limit patterns per category
+        ),
+    )
+    for pattern_name, pattern_config in QUERY_FANOUT_PATTERNS.items()
 )
 
 
@@ -43,7 +64,7 @@ class QueryMapper:
         # Process core entities first (highest priority)
         core_entities = [
             e for e in self.ontology.entities
-            if e.type.value == "core"
+            if e.type is EntityType.CORE
         ]
 
         for entity in core_entities:
@@ -53,7 +74,7 @@ class QueryMapper:
         # Also process high-value supporting entities
         supporting = [
             e for e in self.ontology.entities
-            if e.type.value == "supporting" and e.semantic_centrality > 0.5
+            if e.type is EntityType.SUPPORTING and e.semantic_centrality > 0.5
         ]
 
         for entity in supporting:
@@ -90,20 +111,9 @@ class QueryMapper:
         queries = []
         entity_name = entity.name.lower()
 
-        for pattern_name, pattern_config in QUERY_FANOUT_PATTERNS.items():
-            patterns = pattern_config["patterns"]
-            intent_str = pattern_config["intent"]
-            priority_val = pattern_config["priority"]
-
-            # Map priority number to enum
-            priority_map = {1: ContentPriority.CRITICAL, 2: ContentPriority.HIGH, 3: ContentPriority.MEDIUM}
-            priority = priority_map.get(priority_val, ContentPriority.MEDIUM)
-
-            # Map intent string to enum
-            intent = IntentType(intent_str)
-
-            for pattern in patterns[:3]:  # Limit patterns per category
-                query_text = pattern.replace("{entity}", entity_name)
+        for pattern_name, intent, priority, templates in _FANOUT_TEMPLATES:
+            for parts in templates:
+                query_text = entity_name.join(parts)
 
                 queries.append(Query(
                     query_text=query_text,
@@ -167,10 +177,10 @@ class QueryMapper:
             features.extend(pattern_features[pattern_name])
 
         # Intent-based additions
-        if intent == IntentType.COMMERCIAL:
+        if intent is IntentType.COMMERCIAL:
             if "shopping_ads" not in features:
                 features.append("paa")
-        elif intent == IntentType.TRANSACTIONAL:
+        elif intent is IntentType.TRANSACTIONAL:
             features.append("site_links")
 
         return list(dict.fromkeys(features))  # Dedupe
@@ -303,26 +313,17 @@ class QueryMapper:
         total_queries = sum(len(c.queries) for c in self.clusters.values())
 
         # Intent distribution across all clusters
-        intent_totals: dict[str, int] = {}
+        intent_totals: Counter = Counter()
         for cluster in self.clusters.values():
-            for intent, count in cluster.intent_distribution.items():
-                intent_totals[intent] = intent_totals.get(intent, 0) + count
+            intent_totals.update(cluster.intent_distribution)
+
+        all_queries = [q for c in self.clusters.values() for q in c.queries]
 
         # Pattern distribution
-        pattern_totals: dict[str, int] = {}
-        for cluster in self.clusters.values():
-            for query in cluster.queries:
-                if query.fanout_pattern:
-                    pattern_totals[query.fanout_pattern] = (
-                        pattern_totals.get(query.fanout_pattern, 0) + 1
-                    )
+        pattern_totals = Counter(q.fanout_pattern for q in all_queries if q.fanout_pattern)
 
         # Priority distribution
-        priority_totals: dict[str, int] = {}
-        for cluster in self.clusters.values():
-            for query in cluster.queries:
-                p = query.priority.value
-                priority_totals[p] = priority_totals.get(p, 0) + 1
+        priority_totals = Counter(q.priority.value for q in all_queries)
 
         # SERP feature opportunities
         serp_opportunities = self.get_serp_feature_opportunities()
@@ -334,9 +335,9 @@ class QueryMapper:
             "avg_queries_per_cluster": (
                 total_queries / len(self.clusters) if self.clusters else 0
             ),
-            "intent_distribution": intent_totals,
-            "pattern_distribution": pattern_totals,
-            "priority_distribution": priority_totals,
+            "intent_distribution": dict(intent_totals),
+            "pattern_distribution": dict(pattern_totals),
+            "priority_distribution": dict(priority_totals),
             "serp_opportunities": serp_summary,
             "top_volume_clusters": [
                 {
@@ -10,12 +10,10 @@ import re
 from typing import Any
 
 from utils.data_models import (
-    Entity,
     EntityType,
     Ontology,
     TaxonomyNode,
     Taxonomy,
-    RelationshipType,
 )
 
 
@@ -90,7 +88,7 @@ class TaxonomyBuilder:
         # Get core entities sorted by centrality
         core_entities = [
             e for e in self.ontology.entities
-            if e.type == EntityType.CORE
+            if e.type is EntityType.CORE
         ]
         core_entities.sort(key=lambda x: x.semantic_centrality, reverse=True)
 
@@ -124,7 +122,7 @@ class TaxonomyBuilder:
             # Create subcategories from related entities
             for related_entity, relationship in related[:5]:  # Limit subcategories
                 # Skip competitors
-                if related_entity.type == EntityType.COMPETITOR:
+                if related_entity.type is EntityType.COMPETITOR:
                     continue
 
                 # Skip if already has a category
@@ -209,25 +207,26 @@ class TaxonomyBuilder:
             nodes_by_level[node.level].append(node)
 
         for node in self.nodes.values():
-            links = []
+            # Insertion-ordered dict as an ordered set, so each link is deduped on insert
+            links: dict[str, None] = {}
 
             # Link to parent
             if node.parent_id:
-                links.append(node.parent_id)
+                links[node.parent_id] = None
 
             # Link to siblings (same level, same parent)
             siblings = [
                 n.id for n in self.nodes.values()
                 if n.parent_id == node.parent_id and n.id != node.id
             ]
-            links.extend(siblings[:3])  # Limit sibling links
+            links.update(dict.fromkeys(siblings[:3]))  # Limit sibling links
 
             # Link to children
             children = [
                 n.id for n in self.nodes.values()
                 if n.parent_id == node.id
             ]
-            links.extend(children)
+            links.update(dict.fromkeys(children))
 
             # Link to related nodes via entity relationships
             if node.entity_ids:
@@ -235,10 +234,10 @@ class TaxonomyBuilder:
                     related = self.ontology.get_related_entities(entity_id)
                     for related_entity, _ in related[:3]:
                         related_node = self._find_node_for_entity(related_entity.id)
-                        if related_node and related_node.id not in links:
-                            links.append(related_node.id)
+                        if related_node:
+                            links[related_node.id] = None
 
-            node.internal_links_to = list(dict.fromkeys(links))[:10]  # Dedupe and limit
+            node.internal_links_to = list(links)[:10]  # Limit
 
     def _generate_seo_metadata(self):
         """Generate SEO titles and descriptions for nodes."""
@@ -340,7 +339,7 @@ class TaxonomyBuilder:
             categorized.update(node.entity_ids)
 
         for entity in self.ontology.entities:
-            if entity.id not in categorized and entity.type != EntityType.COMPETITOR:
+            if entity.id not in categorized and entity.type is not EntityType.COMPETITOR:
                 # Find best parent
                 best_parent = None
                 best_score = 0
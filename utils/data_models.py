@@ -1,5 +1,6 @@
 """Pydantic data models for the AI Search Visibility Framework."""
 
+from collections import Counter
 from pydantic import BaseModel, Field
 from typing import Any
 from enum import Enum
@@ -101,10 +102,7 @@ class Ontology(BaseModel):
 
     def entity_count_by_type(self) -> dict[str, int]:
         """Count entities by type."""
-        counts: dict[str, int] = {}
-        for entity in self.entities:
-            counts[entity.type.value] = counts.get(entity.type.value, 0) + 1
-        return counts
+        return dict(Counter(entity.type.value for entity in self.entities))
 
 
 # =============================================================================
@@ -223,12 +221,13 @@ class ContentHub(BaseModel):
 
     def all_pages(self) -> list[HubPage]:
         """Get all pages in the hub."""
-        pages = []
-        if self.pillar_page:
-            pages.append(self.pillar_page)
-        pages.extend(self.cluster_pages)
-        pages.extend(self.supporting_pages)
-        return pages
+        pillar = [self.pillar_page] if self.pillar_page else []
+        return [*pillar, *self.cluster_pages, *self.supporting_pages]
+
+    @property
+    def page_count(self) -> int:
+        """Number of pages in the hub, without building the all_pages() list."""
+        return (self.pillar_page is not None) + len(self.cluster_pages) + len(self.supporting_pages)
 
     def calculate_link_count(self):
         """Calculate total internal links in hub."""
@@ -365,6 +364,17 @@ class FrameworkOutput(BaseModel):
     # Summary statistics
     summary: dict[str, Any] = Field(default_factory=dict)
 
+    # Lookup indices built by index(); derived data, so not serialized
+    children_by_parent: dict[str | None, list[TaxonomyNode]] = Field(default_factory=dict, exclude=True)
+    entity_counts_by_type: dict[str, int] = Field(default_factory=dict, exclude=True)
+    entity_names_by_id: dict[str, str] = Field(default_factory=dict, exclude=True)
+    intent_totals: dict[str, int] = Field(default_factory=dict, exclude=True)
+    priority_counts: dict[str, int] = Field(default_factory=dict, exclude=True)
+    total_pages: int = Field(default=0, exclude=True)
+    total_internal_links: int = Field(default=0, exclude=True)
+    total_aliases: int = Field(default=0, exclude=True)
+    hub_page_counts: dict[str, int] = Field(default_factory=dict, exclude=True)
+
     def generate_summary(self):
         """Generate summary statistics."""
         self.summary = {
@@ -374,8 +384,34 @@ class FrameworkOutput(BaseModel):
             "query_clusters": len(self.query_clusters),
             "total_queries": sum(len(qc.queries) for qc in self.query_clusters),
             "content_hubs": len(self.content_hubs),
-            "total_pages_planned": sum(len(hub.all_pages()) for hub in self.content_hubs),
+            "total_pages_planned": sum(hub.page_count for hub in self.content_hubs),
             "content_specs": len(self.content_specs),
             "kpis_defined": len(self.measurement_plan.kpis) if self.measurement_plan else 0,
         }
         return self.summary
+
+    def index(self):
+        """Build lookup indices so renderers avoid rescanning nodes and entities."""
+        self.children_by_parent = {}
+        if self.taxonomy:
+            for node in self.taxonomy.nodes:
+                self.children_by_parent.setdefault(node.parent_id, []).append(node)
+
+        self.entity_counts_by_type = self.ontology.entity_count_by_type() if self.ontology else {}
+        self.entity_names_by_id = (
+            {e.id: e.name for e in self.ontology.entities} if self.ontology else {}
+        )
+
+        self.hub_page_counts = {h.id: h.page_count for h in self.content_hubs}
+        self.total_pages = sum(self.hub_page_counts.values())
+        self.total_internal_links = sum(h.internal_link_count for h in self.content_hubs)
+        self.total_aliases = (
+            sum(len(e.aliases) for e in self.ontology.entities) if self.ontology else 0
+        )
+
+        intent_totals: Counter = Counter()
+        for cluster in self.query_clusters:
+            intent_totals.update(cluster.intent_distribution)
+        self.intent_totals = dict(intent_totals)
+        self.priority_counts = dict(Counter(s.priority.value for s in self.content_specs))
+        return self
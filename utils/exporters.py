@@ -1,9 +1,7 @@
 """Export utilities for framework outputs in various formats."""
 
-import json
 import csv
 import io
-from datetime import datetime
 from typing import Any
 
 from .data_models import (
@@ -14,6 +12,8 @@ from .data_models import (
     ContentHub,
     ContentSpec,
     MeasurementPlan,
+    EntityType,
+    ContentPriority,
 )
 
 
@@ -60,8 +60,8 @@ class Exporter:
         ])
 
         # Data
-        for entity in ontology.entities:
-            writer.writerow([
+        writer.writerows(
+            [
                 entity.id,
                 entity.name,
                 entity.type.value,
@@ -70,7 +70,9 @@ class Exporter:
                 entity.commercial_value,
                 entity.semantic_centrality,
                 "; ".join(entity.source_urls[:3]),
-            ])
+            ]
+            for entity in ontology.entities
+        )
 
         return output.getvalue()
 
@@ -94,15 +96,17 @@ class Exporter:
         entity_names = {e.id: e.name for e in ontology.entities}
 
         # Data
-        for rel in ontology.relationships:
-            writer.writerow([
+        writer.writerows(
+            [
                 entity_names.get(rel.source_id, rel.source_id),
                 rel.relationship_type.value,
                 entity_names.get(rel.target_id, rel.target_id),
                 rel.weight,
                 "Yes" if rel.bidirectional else "No",
                 rel.context or "",
-            ])
+            ]
+            for rel in ontology.relationships
+        )
 
         return output.getvalue()
 
@@ -125,8 +129,8 @@ class Exporter:
         ])
 
         # Data
-        for node in taxonomy.nodes:
-            writer.writerow([
+        writer.writerows(
+            [
                 node.id,
                 node.name,
                 node.parent_id or "",
@@ -135,7 +139,9 @@ class Exporter:
                 node.seo_title or "",
                 node.target_url or "",
                 "; ".join(node.entity_ids),
-            ])
+            ]
+            for node in taxonomy.nodes
+        )
 
         return output.getvalue()
 
@@ -158,18 +164,20 @@ class Exporter:
         ])
 
         # Data
-        for cluster in query_clusters:
-            for query in cluster.queries:
-                writer.writerow([
-                    cluster.id,
-                    cluster.primary_entity_name,
-                    query.query_text,
-                    query.intent.value,
-                    query.priority.value,
-                    query.estimated_volume or "",
-                    "; ".join(query.serp_features),
-                    query.fanout_pattern or "",
-                ])
+        writer.writerows(
+            [
+                cluster.id,
+                cluster.primary_entity_name,
+                query.query_text,
+                query.intent.value,
+                query.priority.value,
+                query.estimated_volume or "",
+                "; ".join(query.serp_features),
+                query.fanout_pattern or "",
+            ]
+            for cluster in query_clusters
+            for query in cluster.queries
+        )
 
         return output.getvalue()
 
@@ -196,22 +204,24 @@ class Exporter:
         ])
 
         # Data
-        for hub in hubs:
-            for page in hub.all_pages():
-                writer.writerow([
-                    hub.name,
-                    page.id,
-                    page.title,
-                    page.page_type,
-                    page.status,
-                    page.priority.value,
-                    "; ".join(page.target_queries[:3]),
-                    page.recommended_format or "",
-                    page.recommended_word_count or "",
-                    "; ".join(page.schema_types),
-                    page.existing_url or "",
-                    "; ".join(page.internal_links_to[:5]),
-                ])
+        writer.writerows(
+            [
+                hub.name,
+                page.id,
+                page.title,
+                page.page_type,
+                page.status,
+                page.priority.value,
+                "; ".join(page.target_queries[:3]),
+                page.recommended_format or "",
+                page.recommended_word_count or "",
+                "; ".join(page.schema_types),
+                page.existing_url or "",
+                "; ".join(page.internal_links_to[:5]),
+            ]
+            for hub in hubs
+            for page in hub.all_pages()
+        )
 
         return output.getvalue()
 
@@ -321,8 +331,8 @@ class Exporter:
         ]
 
         # Group by type
-        core_entities = [e for e in ontology.entities if e.type.value == "core"]
-        supporting = [e for e in ontology.entities if e.type.value == "supporting"]
+        core_entities = [e for e in ontology.entities if e.type is EntityType.CORE]
+        supporting = [e for e in ontology.entities if e.type is EntityType.SUPPORTING]
 
         for entity in core_entities[:20]:
             aliases_str = f" (aliases: {', '.join(entity.aliases)})" if entity.aliases else ""
@@ -451,8 +461,8 @@ class Exporter:
         ]
 
         # Group by priority
-        critical = [s for s in specs if s.priority.value == "critical"]
-        high = [s for s in specs if s.priority.value == "high"]
+        critical = [s for s in specs if s.priority is ContentPriority.CRITICAL]
+        high = [s for s in specs if s.priority is ContentPriority.HIGH]
 
         if critical:
             lines.append("### Critical Priority Content")
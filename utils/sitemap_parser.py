@@ -3,7 +3,7 @@
 import re
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass, field
-from urllib.parse import urlparse, urljoin
+from urllib.parse import urlparse
 from typing import Any
 import httpx
 
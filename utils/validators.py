@@ -2,7 +2,6 @@
 
 import re
 from urllib.parse import urlparse
-from typing import Any
 
 from config.templates import BrandFoundationConfig, SourceMode
 
@@ -37,6 +36,11 @@ class InputValidator:
         re.IGNORECASE,
     )
 
+    # Character patterns for brand/entity checks
+    INVALID_BRAND_CHARS = re.compile(r"[<>\"'&]")
+    UNSAFE_ENTITY_CHARS = re.compile(r"[<>\"'&\\]")
+    WHITESPACE_RUN = re.compile(r"\s+")
+
     # Sitemap-specific patterns
     SITEMAP_EXTENSIONS = [".xml", "sitemap", "sitemap.xml", "sitemap_index.xml"]
 
@@ -73,11 +77,11 @@ class InputValidator:
             ))
 
         # Source mode specific validation
-        if config.source_mode == SourceMode.SITEMAP:
+        if config.source_mode is SourceMode.SITEMAP:
             errors.extend(cls.validate_sitemap_url(config.sitemap_url))
-        elif config.source_mode == SourceMode.SEED:
+        elif config.source_mode is SourceMode.SEED:
             errors.extend(cls.validate_seed_entities(config.seed_entities))
-        elif config.source_mode == SourceMode.HYBRID:
+        elif config.source_mode is SourceMode.HYBRID:
             # Hybrid requires at least one of sitemap or seed entities
             has_sitemap = config.sitemap_url and cls.is_valid_url(config.sitemap_url)
             has_seeds = config.seed_entities and len(config.seed_entities) > 0
@@ -122,7 +126,7 @@ class InputValidator:
             ))
 
         # Check for problematic characters
-        if re.search(r"[<>\"'&]", brand_name):
+        if cls.INVALID_BRAND_CHARS.search(brand_name):
             errors.append(ValidationError(
                 "brand_name",
                 "Brand name contains invalid characters",
@@ -286,10 +290,10 @@ class InputValidator:
         entity = entity.strip()
 
         # Remove dangerous characters
-        entity = re.sub(r"[<>\"'&\\]", "", entity)
+        entity = cls.UNSAFE_ENTITY_CHARS.sub("", entity)
 
         # Normalize whitespace
-        entity = re.sub(r"\s+", " ", entity)
+        entity = cls.WHITESPACE_RUN.sub(" ", entity)
 
         return entity
 